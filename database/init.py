@@ -19,6 +19,7 @@ Features:
 from .mongo import MongoManager
 from .models import (
     MessageModel,
+    MessageRow,
     EditHistoryModel,
     ReplyChainModel,
     SystemStateModel
@@ -30,6 +31,7 @@ __version__ = "1.0.0"
 __all__ = [
     "MongoManager",
     "MessageModel",
+    "MessageRow",
     "EditHistoryModel",
     "ReplyChainModel",
     "SystemStateModel",
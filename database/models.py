@@ -5,7 +5,7 @@ Pydantic models for data validation and serialization.
 Ensures data consistency and type safety.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, NamedTuple
 from datetime import datetime
 from enum import Enum
 
@@ -107,6 +107,34 @@ class MessageModel(BaseModel):
         return data
 
 
+class MessageRow(NamedTuple):
+    """
+    Lightweight read-only view of a stored message.
+    
+    Returned by message lookups instead of the full document dict,
+    so handlers use attribute access rather than dict lookups.
+    """
+    
+    original_id: int
+    group_id: Optional[int]
+    sender: str
+    content: str
+    has_media: bool
+    reply_to_original: Optional[int]
+    
+    @classmethod
+    def from_doc(cls, doc: Dict[str, Any]) -> "MessageRow":
+        """Build row from a MongoDB message document."""
+        return cls(
+            doc['original_id'],
+            doc.get('group_id'),
+            doc.get('sender', 'unknown'),
+            doc.get('content', ''),
+            doc.get('has_media', False),
+            doc.get('reply_to_original')
+        )
+
+
 class EditHistoryModel(BaseModel):
     """
     Edit history tracking model.
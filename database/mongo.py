@@ -151,6 +151,13 @@ class MongoManager:
             await replies.create_index("original_id")
             await replies.create_index("reply_to_id")
             
+            # Media cache indexes
+            media_cache = self.database.media_cache
+            await media_cache.create_index(
+                [("photo_id", 1), ("sender", 1)],
+                unique=True
+            )
+            
             # System state indexes
             state = self.database.system_state
             await state.create_index("key", unique=True)
@@ -9,6 +9,7 @@ import asyncio
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
+from pymongo import UpdateOne
 from pymongo.errors import (
     DuplicateKeyError,
     WriteError,
@@ -19,6 +20,7 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 from .mongo import MongoManager
 from .models import (
     MessageModel,
+    MessageRow,
     EditHistoryModel,
     ReplyChainModel,
     SystemStateModel,
@@ -138,7 +140,7 @@ class DatabaseOperations:
             )
             
             # Update cache
-            self._cache[f"msg_{original_id}"] = message.to_dict()
+            self._cache[f"msg_{original_id}"] = MessageRow.from_doc(message.to_dict())
             
             # Update last processed ID
             await self.update_last_processed_id(original_id)
@@ -154,10 +156,70 @@ class DatabaseOperations:
             logger.error(f"Failed to save message: {e}")
             return False
     
+    async def save_messages_bulk(self, messages: List[Dict[str, Any]]) -> List[int]:
+        """
+        Save several messages with one unordered insert.
+        
+        Unlike save_message(), this leaves the last processed ID to the
+        caller.
+        
+        Args:
+            messages: save_message() keyword arguments, one dict per message
+            
+        Returns:
+            List[int]: IDs now stored (inserted or already present)
+        """
+        docs = []
+        
+        for fields in messages:
+            try:
+                fields = dict(fields)
+                docs.append(MessageModel(
+                    sender=SenderType(fields.pop('sender')),
+                    media_type=MediaType(fields.pop('media_type', None) or "none"),
+                    **fields
+                ).to_dict())
+            except Exception as e:
+                logger.error(f"Failed to save message {fields.get('original_id')}: {e}")
+        
+        if not docs:
+            return []
+        
+        try:
+            # Unordered: duplicates are reported but don't stop the rest
+            result = await self.db.messages.insert_many(docs, ordered=False)
+            inserted = len(result.inserted_ids)
+            
+        except BulkWriteError as e:
+            inserted = e.details.get('nInserted', 0)
+            
+            # Duplicates are already stored; any other error is not
+            failed = {
+                error['index'] for error in e.details.get('writeErrors', [])
+                if error.get('code') != 11000
+            }
+            if failed:
+                logger.error(f"Failed to save {len(failed)} messages")
+                docs = [doc for i, doc in enumerate(docs) if i not in failed]
+            
+            if len(docs) > inserted:
+                logger.warning(f"{len(docs) - inserted} messages already exist")
+                
+        except Exception as e:
+            logger.error(f"Failed to save messages: {e}")
+            return []
+        
+        # Update cache
+        for doc in docs:
+            self._cache[f"msg_{doc['original_id']}"] = MessageRow.from_doc(doc)
+        
+        logger.debug(f"💾 {inserted} messages saved")
+        return [doc['original_id'] for doc in docs]
+    
     async def get_message(
         self,
         original_id: int
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[MessageRow]:
         """
         Get message by original ID.
         
@@ -165,7 +227,7 @@ class DatabaseOperations:
             original_id: Message ID in DM
             
         Returns:
-            Optional[Dict]: Message data if found
+            Optional[MessageRow]: Message data if found
         """
         try:
             # Check cache first
@@ -178,10 +240,13 @@ class DatabaseOperations:
                 {"original_id": original_id}
             )
             
-            if message:
-                self._cache[cache_key] = message
+            if not message:
+                return None
+            
+            row = MessageRow.from_doc(message)
+            self._cache[cache_key] = row
             
-            return message
+            return row
             
         except Exception as e:
             logger.error(f"Failed to get message: {e}")
@@ -208,6 +273,30 @@ class DatabaseOperations:
             logger.error(f"Failed to check message existence: {e}")
             return False
     
+    async def messages_existing(self, original_ids: List[int]) -> set:
+        """
+        Check which of several messages exist, in one query.
+        
+        Args:
+            original_ids: Message IDs to check
+            
+        Returns:
+            set: IDs found in database
+        """
+        if not original_ids:
+            return set()
+        
+        try:
+            cursor = self.db.messages.find(
+                {"original_id": {"$in": original_ids}},
+                {"_id": 0, "original_id": 1}
+            )
+            return {doc["original_id"] async for doc in cursor}
+            
+        except Exception as e:
+            logger.error(f"Failed to check message existence: {e}")
+            return set()
+    
     async def get_messages_batch(
         self,
         original_ids: List[int]
@@ -230,7 +319,7 @@ class DatabaseOperations:
             
             # Update cache
             for msg in messages:
-                self._cache[f"msg_{msg['original_id']}"] = msg
+                self._cache[f"msg_{msg['original_id']}"] = MessageRow.from_doc(msg)
             
             return messages
             
@@ -238,6 +327,36 @@ class DatabaseOperations:
             logger.error(f"Failed to get message batch: {e}")
             return []
     
+    async def get_messages(
+        self,
+        original_ids: List[int]
+    ) -> Dict[int, MessageRow]:
+        """
+        Get multiple messages keyed by original ID.
+        Cached messages are served directly; the rest in one query.
+        
+        Args:
+            original_ids: List of message IDs
+            
+        Returns:
+            Dict[int, MessageRow]: Message data by original ID (missing IDs omitted)
+        """
+        found = {}
+        missing = []
+        
+        for original_id in original_ids:
+            cached = self._cache.get(f"msg_{original_id}")
+            if cached:
+                found[original_id] = cached
+            else:
+                missing.append(original_id)
+        
+        if missing:
+            for msg in await self.get_messages_batch(missing):
+                found[msg['original_id']] = self._cache[f"msg_{msg['original_id']}"]
+        
+        return found
+    
     # ==================== EDIT OPERATIONS ====================
     
     async def add_edit(
@@ -265,7 +384,7 @@ class DatabaseOperations:
                 logger.warning(f"Message not found for edit: {original_id}")
                 return False
             
-            old_content = message.get('content', '')
+            old_content = message.content
             
             # Create edit history entry
             edit = EditHistoryModel(
@@ -301,6 +420,71 @@ class DatabaseOperations:
             logger.error(f"Failed to add edit: {e}")
             return False
     
+    async def add_edits_many(
+        self,
+        edits: List[Tuple[int, str, Optional[int]]]
+    ) -> int:
+        """
+        Add several edit history entries with two bulk writes.
+        
+        Args:
+            edits: (original_id, new_content, edit_notification_id) tuples,
+                oldest first
+                
+        Returns:
+            int: Number of edits saved
+        """
+        try:
+            messages = await self.get_messages(list({edit[0] for edit in edits}))
+            
+            history = []
+            latest = {}
+            
+            for original_id, new_content, edit_notification_id in edits:
+                message = messages.get(original_id)
+                
+                if not message:
+                    logger.warning(f"Message not found for edit: {original_id}")
+                    continue
+                
+                # Chain edits of the same message within the batch
+                old_content = latest.get(original_id, message.content)
+                
+                history.append(EditHistoryModel(
+                    original_id=original_id,
+                    old_content=old_content,
+                    new_content=new_content,
+                    edit_notification_id=edit_notification_id
+                ).dict())
+                latest[original_id] = new_content
+            
+            if not history:
+                return 0
+            
+            # Save edit history and update messages
+            await self.db.edit_history.insert_many(history)
+            await self.db.messages.bulk_write(
+                [
+                    UpdateOne(
+                        {"original_id": original_id},
+                        {"$set": {"content": content, "is_edited": True}}
+                    )
+                    for original_id, content in latest.items()
+                ],
+                ordered=False
+            )
+            
+            # Invalidate cache
+            for original_id in latest:
+                self._cache.pop(f"msg_{original_id}", None)
+            
+            logger.debug(f"✏️ {len(history)} edits saved")
+            return len(history)
+            
+        except Exception as e:
+            logger.error(f"Failed to add edits: {e}")
+            return 0
+    
     async def get_edit_history(
         self,
         original_id: int
@@ -355,6 +539,33 @@ class DatabaseOperations:
             logger.error(f"Failed to mark as deleted: {e}")
             return False
     
+    async def mark_deleted_many(self, original_ids: List[int]) -> int:
+        """
+        Mark several messages as deleted in one update.
+        
+        Args:
+            original_ids: Message IDs to mark as deleted
+            
+        Returns:
+            int: Number of messages marked
+        """
+        try:
+            result = await self.db.messages.update_many(
+                {"original_id": {"$in": original_ids}},
+                {"$set": {"is_deleted": True}}
+            )
+            
+            # Invalidate cache
+            for original_id in original_ids:
+                self._cache.pop(f"msg_{original_id}", None)
+            
+            logger.debug(f"🗑️ {result.modified_count} messages marked as deleted")
+            return result.modified_count
+            
+        except Exception as e:
+            logger.error(f"Failed to mark messages as deleted: {e}")
+            return 0
+    
     # ==================== REPLY OPERATIONS ====================
     
     async def save_reply_mapping(
@@ -393,6 +604,71 @@ class DatabaseOperations:
             logger.error(f"Failed to save reply mapping: {e}")
             return False
     
+    # ==================== MEDIA CACHE OPERATIONS ====================
+    
+    async def save_media_cache(
+        self,
+        photo_id: int,
+        sender: str,
+        file_id: int,
+        access_hash: int,
+        file_reference: bytes
+    ) -> bool:
+        """
+        Remember a photo already uploaded by a bot.
+        
+        Args:
+            photo_id: Photo ID in DM
+            sender: 'you' or 'her' (uploads are per bot)
+            file_id: Photo ID as uploaded by the bot
+            access_hash: Bot's access hash for the photo
+            file_reference: Bot's file reference for the photo
+            
+        Returns:
+            bool: True if saved successfully
+        """
+        try:
+            await self.db.media_cache.update_one(
+                {"photo_id": photo_id, "sender": sender},
+                {
+                    "$set": {
+                        "file_id": file_id,
+                        "access_hash": access_hash,
+                        "file_reference": file_reference
+                    }
+                },
+                upsert=True
+            )
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to save media cache: {e}")
+            return False
+    
+    async def get_media_cache(
+        self,
+        photo_id: int,
+        sender: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a bot's previous upload of a photo.
+        
+        Args:
+            photo_id: Photo ID in DM
+            sender: 'you' or 'her'
+            
+        Returns:
+            Optional[Dict]: Cached upload reference if found
+        """
+        try:
+            return await self.db.media_cache.find_one(
+                {"photo_id": photo_id, "sender": sender}
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to get media cache: {e}")
+            return None
+    
     # ==================== SYSTEM STATE OPERATIONS ====================
     
     async def update_last_processed_id(self, message_id: int) -> bool:
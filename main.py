@@ -249,6 +249,11 @@ class Application:
         """
         from utils.helpers import format_duration, format_file_size
         
+        # Fetch DB stats in the background while printing
+        db_task = None
+        if self.monitor and self.monitor.db:
+            db_task = asyncio.create_task(self.monitor.db.get_statistics())
+        
         print("\n" + "=" * 60)
         print("📊 RUNTIME STATISTICS")
         print("=" * 60)
@@ -257,9 +262,9 @@ class Application:
         print(f"⏱️  Runtime: {format_duration(runtime)}")
         
         # Database stats
-        if self.monitor and self.monitor.db:
+        if db_task:
             try:
-                db_stats = await self.monitor.db.get_statistics()
+                db_stats = await db_task
                 print(f"💬 Messages processed: {db_stats.total_messages}")
                 print(f"📸 Media processed: {db_stats.total_media}")
                 print(f"🔥 View-once saved: {db_stats.total_view_once}")
@@ -275,7 +280,7 @@ class Application:
             print(f"🧠 Memory (avg): {mem_stats.get('average_mb', 0):.1f} MB")
         
         # Log stats
-        log_stats = await get_log_stats().get_stats()
+        log_stats = get_log_stats().get_stats()
         print(f"📝 Total logs: {log_stats.get('total_logs', 0)}")
         print(f"❌ Errors: {log_stats.get('error_count', 0)}")
         
@@ -14,12 +14,15 @@ Features:
     ✨ Beautiful UI
 """
 
+import io
 import os
+import re
 import sys
 import asyncio
 import json
+from contextlib import contextmanager, redirect_stdout
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, Callable
 from getpass import getpass
 
 try:
@@ -36,6 +39,38 @@ except ImportError:
     class Style:
         BRIGHT = DIM = RESET_ALL = ""
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Validation patterns
+_BOT_TOKEN_RE = re.compile(r'\d+:[A-Za-z0-9_-]{21,}')
+_PHONE_RE = re.compile(r'\+[\d ]*\d[\d ]*')
+_API_HASH_RE = re.compile(r'[0-9a-fA-F]{32}')
+_GROUP_ID_RE = re.compile(r'-100\d+')
+_API_ID_RE = re.compile(r'\d+')
+_ID_RE = re.compile(r'-?\d+')
+
+# .env sections in output order, keyed by key prefix ('' catches the rest)
+_ENV_SECTIONS = {
+    'TELEGRAM_': "TELEGRAM CONFIGURATION",
+    'MONGODB_': "MONGODB CONFIGURATION",
+    '': "OPTIONAL SETTINGS"
+}
+_ENV_PREFIXES = tuple(prefix for prefix in _ENV_SECTIONS if prefix)
+
+
+@contextmanager
+def _buffered_output():
+    """Collect prints inside the block and emit them in a single write."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        yield
+    sys.stdout.write(buffer.getvalue())
+    sys.stdout.flush()
+
+
 # Banner
 SETUP_BANNER = f"""
 {Fore.CYAN}{Style.BRIGHT}
@@ -46,7 +81,7 @@ SETUP_BANNER = f"""
 ║          Interactive Configuration Wizard v1.0            ║
 ║                                                           ║
 ╚═══════════════════════════════════════════════════════════╝
-{Style.RESET_ALL}
+
 """
 
 
@@ -69,29 +104,31 @@ class SetupWizard:
     
     def print_header(self, text: str) -> None:
         """Print section header."""
-        print(f"\n{Fore.CYAN}{Style.BRIGHT}{'=' * 60}")
-        print(f"  {text}")
-        print(f"{'=' * 60}{Style.RESET_ALL}\n")
+        with _buffered_output():
+            print(f"\n{Fore.CYAN}{Style.BRIGHT}{'=' * 60}")
+            print(f"  {text}")
+            print(f"{'=' * 60}\n")
     
     def print_step(self, step: int, total: int, description: str) -> None:
         """Print step information."""
-        print(f"{Fore.YELLOW}[Step {step}/{total}] {description}{Style.RESET_ALL}\n")
+        with _buffered_output():
+            print(f"{Fore.YELLOW}[Step {step}/{total}] {description}\n")
     
     def print_success(self, message: str) -> None:
         """Print success message."""
-        print(f"{Fore.GREEN}✅ {message}{Style.RESET_ALL}")
+        print(f"{Fore.GREEN}✅ {message}")
     
     def print_error(self, message: str) -> None:
         """Print error message."""
-        print(f"{Fore.RED}❌ {message}{Style.RESET_ALL}")
+        print(f"{Fore.RED}❌ {message}")
     
     def print_warning(self, message: str) -> None:
         """Print warning message."""
-        print(f"{Fore.YELLOW}⚠️  {message}{Style.RESET_ALL}")
+        print(f"{Fore.YELLOW}⚠️  {message}")
     
     def print_info(self, message: str) -> None:
         """Print info message."""
-        print(f"{Fore.CYAN}💡 {message}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}💡 {message}")
     
     def prompt(self, question: str, default: str = None, secret: bool = False) -> str:
         """
@@ -117,6 +154,41 @@ class SetupWizard:
         
         return value.strip() or default
     
+    def ask(
+        self,
+        question: str,
+        env_key: str,
+        config_key: str,
+        validate: Optional[Callable[[str], Any]] = None,
+        error: str = None,
+        transform=str,
+        default: str = None,
+        secret: bool = False
+    ) -> str:
+        """
+        Prompt until the answer is valid, then record it.
+        
+        Args:
+            question: Question to ask
+            env_key: Key to store in .env
+            config_key: Key to store in config.json
+            validate: Check the answer must pass, e.g. a pattern's fullmatch (optional)
+            error: Message shown when the answer does not match
+            transform: Conversion applied to the config.json value
+            default: Default value
+            secret: Hide input (for passwords)
+            
+        Returns:
+            str: Accepted answer
+        """
+        while True:
+            value = self.prompt(question, default, secret)
+            if validate is None or (value and validate(value)):
+                self.env_vars[env_key] = value
+                self.config[config_key] = transform(value)
+                return value
+            self.print_error(error)
+    
     def prompt_yes_no(self, question: str, default: bool = True) -> bool:
         """
         Prompt yes/no question.
@@ -141,9 +213,12 @@ class SetupWizard:
             bool: True if setup successful
         """
         try:
-            print(SETUP_BANNER)
-            print(f"{Fore.WHITE}Welcome! Let's configure your Telegram Mirror Bot.{Style.RESET_ALL}")
-            print(f"{Fore.WHITE}This wizard will guide you through the setup process.{Style.RESET_ALL}\n")
+            # One write through sys.stdout, so colorama still strips the
+            # ANSI codes when output is piped
+            with _buffered_output():
+                print(f"{SETUP_BANNER}{Style.RESET_ALL}")
+                print(f"{Fore.WHITE}Welcome! Let's configure your Telegram Mirror Bot.")
+                print(f"{Fore.WHITE}This wizard will guide you through the setup process.\n")
             
             # Step 1: Telegram Configuration
             if not await self.setup_telegram():
@@ -167,16 +242,17 @@ class SetupWizard:
             
             # Success!
             self.print_header("✅ SETUP COMPLETE!")
-            print(f"{Fore.GREEN}Your Telegram Mirror Bot is now configured!{Style.RESET_ALL}\n")
-            print(f"{Fore.CYAN}Next steps:{Style.RESET_ALL}")
-            print(f"  1. Review your configuration in {Fore.YELLOW}.env{Style.RESET_ALL}")
-            print(f"  2. Add both bots to your backup group")
-            print(f"  3. Run the bot: {Fore.GREEN}python main.py{Style.RESET_ALL}\n")
+            with _buffered_output():
+                print(f"{Fore.GREEN}Your Telegram Mirror Bot is now configured!\n")
+                print(f"{Fore.CYAN}Next steps:{Style.RESET_ALL}")
+                print(f"  1. Review your configuration in {Fore.YELLOW}.env{Style.RESET_ALL}")
+                print(f"  2. Add both bots to your backup group")
+                print(f"  3. Run the bot: {Fore.GREEN}python main.py\n")
             
             return True
             
         except KeyboardInterrupt:
-            print(f"\n\n{Fore.YELLOW}Setup cancelled by user.{Style.RESET_ALL}")
+            print(f"\n\n{Fore.YELLOW}Setup cancelled by user.")
             return False
         except Exception as e:
             self.print_error(f"Setup failed: {e}")
@@ -187,104 +263,61 @@ class SetupWizard:
         self.print_header("📱 TELEGRAM CONFIGURATION")
         self.print_step(1, 5, "Telegram API & Bots")
         
-        print(f"{Fore.CYAN}First, we need your Telegram API credentials.{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}First, we need your Telegram API credentials.")
         self.print_info("Get them from: https://my.telegram.org/apps\n")
         
-        # API ID
-        while True:
-            api_id = self.prompt("Enter your API ID")
-            if api_id and api_id.isdigit():
-                self.env_vars['TELEGRAM_API_ID'] = api_id
-                self.config['api_id'] = int(api_id)
-                break
-            self.print_error("Invalid API ID. Must be a number.")
-        
-        # API Hash
-        while True:
-            api_hash = self.prompt("Enter your API Hash", secret=True)
-            if api_hash and len(api_hash) == 32:
-                self.env_vars['TELEGRAM_API_HASH'] = api_hash
-                self.config['api_hash'] = api_hash
-                break
-            self.print_error("Invalid API Hash. Should be 32 characters.")
-        
-        print(f"\n{Fore.CYAN}Now, let's setup your bots.{Style.RESET_ALL}")
-        self.print_info("Create bots with @BotFather on Telegram\n")
-        
-        # Your Bot Token
-        while True:
-            your_token = self.prompt("Enter YOUR bot token (for your messages)", secret=True)
-            if self.validate_bot_token(your_token):
-                self.env_vars['TELEGRAM_YOUR_BOT_TOKEN'] = your_token
-                self.config['your_bot_token'] = your_token
-                break
-            self.print_error("Invalid bot token format.")
-        
-        # Your Bot Name
-        your_name = self.prompt("Enter YOUR bot name", "YourBot")
-        self.env_vars['TELEGRAM_YOUR_BOT_NAME'] = your_name
-        self.config['your_bot_name'] = your_name
-        
-        # Her Bot Token
-        while True:
-            her_token = self.prompt("Enter HER bot token (for her messages)", secret=True)
-            if self.validate_bot_token(her_token):
-                self.env_vars['TELEGRAM_HER_BOT_TOKEN'] = her_token
-                self.config['her_bot_token'] = her_token
-                break
-            self.print_error("Invalid bot token format.")
+        self.ask(
+            "Enter your API ID", 'TELEGRAM_API_ID', 'api_id',
+            _API_ID_RE.fullmatch, "Invalid API ID. Must be a number.", int
+        )
+        self.ask(
+            "Enter your API Hash", 'TELEGRAM_API_HASH', 'api_hash',
+            _API_HASH_RE.fullmatch, "Invalid API Hash. Should be 32 characters.", secret=True
+        )
         
-        # Her Bot Name
-        her_name = self.prompt("Enter HER bot name", "HerBot")
-        self.env_vars['TELEGRAM_HER_BOT_NAME'] = her_name
-        self.config['her_bot_name'] = her_name
+        print(f"\n{Fore.CYAN}Now, let's setup your bots.")
+        self.print_info("Create bots with @BotFather on Telegram\n")
         
-        print(f"\n{Fore.CYAN}Account & User Information{Style.RESET_ALL}\n")
-        
-        # Your Phone
-        while True:
-            phone = self.prompt("Enter YOUR phone number (with +)", "+1234567890")
-            if phone.startswith('+') and phone[1:].replace(' ', '').isdigit():
-                self.env_vars['TELEGRAM_YOUR_PHONE'] = phone
-                self.config['your_phone'] = phone
-                break
-            self.print_error("Invalid phone format. Must start with + and contain digits.")
-        
-        # Your Name
-        your_display_name = self.prompt("Enter YOUR display name", "You")
-        self.env_vars['TELEGRAM_YOUR_NAME'] = your_display_name
-        self.config['your_name'] = your_display_name
+        self.ask(
+            "Enter YOUR bot token (for your messages)", 'TELEGRAM_YOUR_BOT_TOKEN', 'your_bot_token',
+            self.validate_bot_token, "Invalid bot token format.", secret=True
+        )
+        self.ask("Enter YOUR bot name", 'TELEGRAM_YOUR_BOT_NAME', 'your_bot_name', default="YourBot")
+        self.ask(
+            "Enter HER bot token (for her messages)", 'TELEGRAM_HER_BOT_TOKEN', 'her_bot_token',
+            self.validate_bot_token, "Invalid bot token format.", secret=True
+        )
+        self.ask("Enter HER bot name", 'TELEGRAM_HER_BOT_NAME', 'her_bot_name', default="HerBot")
+        
+        print(f"\n{Fore.CYAN}Account & User Information\n")
+        
+        self.ask(
+            "Enter YOUR phone number (with +)", 'TELEGRAM_YOUR_PHONE', 'your_phone',
+            self.validate_phone, "Invalid phone format. Must start with + and contain digits.",
+            default="+1234567890"
+        )
+        self.ask("Enter YOUR display name", 'TELEGRAM_YOUR_NAME', 'your_name', default="You")
         
         # Her User ID
-        print(f"\n{Fore.CYAN}To get her Telegram ID, you can:{Style.RESET_ALL}")
+        print(f"\n{Fore.CYAN}To get her Telegram ID, you can:")
         print("  1. Forward a message from her to @userinfobot")
         print("  2. Use @RawDataBot\n")
         
-        while True:
-            her_id = self.prompt("Enter HER Telegram User ID")
-            if her_id and (her_id.isdigit() or (her_id.startswith('-') and her_id[1:].isdigit())):
-                self.env_vars['TELEGRAM_HER_USER_ID'] = her_id
-                self.config['her_user_id'] = int(her_id)
-                break
-            self.print_error("Invalid User ID. Must be a number.")
-        
-        # Her Name
-        her_display_name = self.prompt("Enter HER display name", "Her")
-        self.env_vars['TELEGRAM_HER_NAME'] = her_display_name
-        self.config['her_name'] = her_display_name
+        self.ask(
+            "Enter HER Telegram User ID", 'TELEGRAM_HER_USER_ID', 'her_user_id',
+            _ID_RE.fullmatch, "Invalid User ID. Must be a number.", int
+        )
+        self.ask("Enter HER display name", 'TELEGRAM_HER_NAME', 'her_name', default="Her")
         
         # Backup Group ID
-        print(f"\n{Fore.CYAN}Backup Group Configuration{Style.RESET_ALL}")
+        print(f"\n{Fore.CYAN}Backup Group Configuration")
         print("Create a group and add both bots to it.")
         print("To get group ID, forward a message from the group to @userinfobot\n")
         
-        while True:
-            group_id = self.prompt("Enter BACKUP GROUP ID (starts with -100)")
-            if group_id and group_id.startswith('-100') and group_id[1:].isdigit():
-                self.env_vars['TELEGRAM_GROUP_ID'] = group_id
-                self.config['group_id'] = int(group_id)
-                break
-            self.print_error("Invalid Group ID. Should start with -100")
+        self.ask(
+            "Enter BACKUP GROUP ID (starts with -100)", 'TELEGRAM_GROUP_ID', 'group_id',
+            _GROUP_ID_RE.fullmatch, "Invalid Group ID. Should start with -100", int
+        )
         
         self.print_success("Telegram configuration complete!\n")
         return True
@@ -294,7 +327,7 @@ class SetupWizard:
         self.print_header("🗄️  MONGODB CONFIGURATION")
         self.print_step(2, 5, "Database Settings")
         
-        print(f"{Fore.CYAN}Configure your MongoDB connection.{Style.RESET_ALL}\n")
+        print(f"{Fore.CYAN}Configure your MongoDB connection.\n")
         
         # MongoDB Host
         host = self.prompt("MongoDB Host", "localhost")
@@ -333,7 +366,7 @@ class SetupWizard:
             self.print_info("Using default settings for all optional configurations.")
             return True
         
-        print(f"\n{Fore.CYAN}Media Processing{Style.RESET_ALL}\n")
+        print(f"\n{Fore.CYAN}Media Processing\n")
         
         # Photo Optimization
         if self.prompt_yes_no("Enable automatic photo optimization?", True):
@@ -345,7 +378,7 @@ class SetupWizard:
         if self.prompt_yes_no("Enable automatic video compression?", False):
             self.env_vars['MEDIA_COMPRESS_VIDEOS'] = "true"
         
-        print(f"\n{Fore.CYAN}Logging{Style.RESET_ALL}\n")
+        print(f"\n{Fore.CYAN}Logging\n")
         
         # Log Level
         log_level = self.prompt("Log level (DEBUG/INFO/WARNING/ERROR)", "INFO")
@@ -364,6 +397,9 @@ class SetupWizard:
         self.print_step(4, 5, "Writing Configuration Files")
         
         try:
+            # File writes run in the default thread pool
+            loop = asyncio.get_running_loop()
+            
             # Create .env file
             env_path = Path('.env')
             
@@ -374,38 +410,36 @@ class SetupWizard:
                 
                 # Backup existing
                 backup_path = Path('.env.backup')
-                env_path.rename(backup_path)
+                await loop.run_in_executor(None, env_path.rename, backup_path)
                 self.print_info(f"Existing .env backed up to {backup_path}")
             
-            # Write .env
-            with open(env_path, 'w') as f:
-                f.write("# Telegram Mirror Bot Configuration\n")
-                f.write("# Generated by setup wizard\n\n")
-                
-                # Telegram Section
-                f.write("# === TELEGRAM CONFIGURATION ===\n")
-                for key, value in self.env_vars.items():
-                    if key.startswith('TELEGRAM_'):
-                        f.write(f"{key}={value}\n")
-                
-                # MongoDB Section
-                f.write("\n# === MONGODB CONFIGURATION ===\n")
-                for key, value in self.env_vars.items():
-                    if key.startswith('MONGODB_'):
-                        f.write(f"{key}={value}\n")
-                
-                # Other Sections
-                f.write("\n# === OPTIONAL SETTINGS ===\n")
-                for key, value in self.env_vars.items():
-                    if not key.startswith('TELEGRAM_') and not key.startswith('MONGODB_'):
-                        f.write(f"{key}={value}\n")
+            # Bucket settings by section prefix in a single pass
+            buckets = {prefix: [] for prefix in _ENV_SECTIONS}
+            for key, value in self.env_vars.items():
+                for prefix in _ENV_PREFIXES:
+                    if key.startswith(prefix):
+                        break
+                else:
+                    prefix = ''
+                buckets[prefix].append(f"{key}={value}\n")
+            
+            # Write .env in one go
+            body = "# Telegram Mirror Bot Configuration\n# Generated by setup wizard\n" + "".join(
+                f"\n# === {title} ===\n" + "".join(buckets[prefix])
+                for prefix, title in _ENV_SECTIONS.items()
+            )
+            await loop.run_in_executor(None, env_path.write_text, body, 'utf-8')
             
             self.print_success(f"Configuration saved to {env_path}")
             
             # Create config.json for backup
+            if orjson:
+                data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.config, indent=2).encode('utf-8')
+            
             config_path = Path('config.json')
-            with open(config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            await loop.run_in_executor(None, config_path.write_bytes, data)
             
             self.print_success(f"Backup config saved to {config_path}\n")
             
@@ -420,7 +454,7 @@ class SetupWizard:
         self.print_header("🧪 TESTING CONNECTIONS")
         self.print_step(5, 5, "Connectivity Tests")
         
-        print(f"{Fore.CYAN}Testing MongoDB connection...{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Testing MongoDB connection...")
         
         try:
             from motor.motor_asyncio import AsyncIOMotorClient
@@ -443,9 +477,10 @@ class SetupWizard:
             self.print_error(f"MongoDB connection failed: {e}")
             self.print_warning("Please check your MongoDB configuration.")
         
-        print(f"\n{Fore.CYAN}Note: Bot token validation requires running the main bot.{Style.RESET_ALL}")
+        print(f"\n{Fore.CYAN}Note: Bot token validation requires running the main bot.")
     
-    def validate_bot_token(self, token: str) -> bool:
+    @staticmethod
+    def validate_bot_token(token: str) -> bool:
         """
         Validate bot token format.
         
@@ -455,14 +490,7 @@ class SetupWizard:
         Returns:
             bool: True if valid format
         """
-        if not token:
-            return False
-        
-        parts = token.split(':')
-        if len(parts) != 2:
-            return False
-        
-        return parts[0].isdigit() and len(parts[1]) > 20
+        return bool(_BOT_TOKEN_RE.fullmatch(token or ""))
     
     @staticmethod
     def validate_phone(phone: str) -> bool:
@@ -475,7 +503,7 @@ class SetupWizard:
         Returns:
             bool: True if valid
         """
-        return phone.startswith('+') and phone[1:].replace(' ', '').isdigit()
+        return bool(_PHONE_RE.fullmatch(phone or ""))
 
 
 # ==================== MAIN FUNCTION ====================
@@ -495,8 +523,8 @@ if __name__ == "__main__":
         exit_code = asyncio.run(main())
         sys.exit(exit_code)
     except KeyboardInterrupt:
-        print(f"\n{Fore.YELLOW}Setup cancelled.{Style.RESET_ALL}")
+        print(f"\n{Fore.YELLOW}Setup cancelled.")
         sys.exit(1)
     except Exception as e:
-        print(f"\n{Fore.RED}Setup error: {e}{Style.RESET_ALL}")
+        print(f"\n{Fore.RED}Setup error: {e}")
         sys.exit(1)
@@ -5,6 +5,10 @@ Handles initialization and management of bot clients.
 Uses Telethon for bots (MTProto) to bypass 50MB HTTP limit.
 """
 
+import asyncio
+from functools import partial
+from typing import BinaryIO, Union
+
 from telethon import TelegramClient
 from telethon.errors import (
     AuthKeyUnregisteredError,
@@ -27,6 +31,11 @@ class BotManager:
         group_id: Target backup group ID
     """
     
+    __slots__ = (
+        'settings', 'your_bot', 'her_bot', 'group_id', '_initialized',
+        '_bots', '_names', '_group_peers', '_send_message', '_send_file'
+    )
+    
     def __init__(self, settings: Settings):
         """
         Initialize bot manager with settings.
@@ -39,6 +48,20 @@ class BotManager:
         self.her_bot: TelegramClient = None
         self.group_id = settings.GROUP_ID
         self._initialized = False
+        
+        # Indexed by is_outgoing: (her, yours)
+        self._bots = (None, None)
+        self._names = (settings.HER_NAME, settings.YOUR_NAME)
+        self._group_peers = (None, None)
+        
+        # Send calls pre-bound to the group, indexed by is_outgoing
+        self._send_message = (self._not_initialized, self._not_initialized)
+        self._send_file = (self._not_initialized, self._not_initialized)
+    
+    @staticmethod
+    async def _not_initialized(*args, **kwargs):
+        """Placeholder send used until initialize() has run."""
+        raise RuntimeError("BotManager not initialized. Call initialize() first.")
     
     async def initialize(self) -> bool:
         """
@@ -48,29 +71,41 @@ class BotManager:
             bool: True if both bots initialized successfully
         """
         try:
-            # Initialize YOUR bot
+            # Create both clients
             self.your_bot = TelegramClient(
                 session=f"sessions/{self.settings.YOUR_BOT_NAME}",
                 api_id=self.settings.API_ID,
                 api_hash=self.settings.API_HASH
             )
-            
-            await self.your_bot.start(bot_token=self.settings.YOUR_BOT_TOKEN)
-            logger.info(f"✅ {self.settings.YOUR_BOT_NAME} initialized")
-            
-            # Initialize HER bot
             self.her_bot = TelegramClient(
                 session=f"sessions/{self.settings.HER_BOT_NAME}",
                 api_id=self.settings.API_ID,
                 api_hash=self.settings.API_HASH
             )
             
-            await self.her_bot.start(bot_token=self.settings.HER_BOT_TOKEN)
-            logger.info(f"✅ {self.settings.HER_BOT_NAME} initialized")
+            # Start both bots concurrently (independent sessions)
+            await asyncio.gather(
+                self.your_bot.start(bot_token=self.settings.YOUR_BOT_TOKEN),
+                self.her_bot.start(bot_token=self.settings.HER_BOT_TOKEN)
+            )
+            logger.info(
+                "✅ %s and %s initialized",
+                self.settings.YOUR_BOT_NAME, self.settings.HER_BOT_NAME
+            )
             
             # Verify both bots are in the group
             await self._verify_group_membership()
             
+            self._bots = (self.her_bot, self.your_bot)
+            her_peer, your_peer = self._group_peers
+            self._send_message = (
+                partial(self.her_bot.send_message, her_peer),
+                partial(self.your_bot.send_message, your_peer)
+            )
+            self._send_file = (
+                partial(self.her_bot.send_file, her_peer),
+                partial(self.your_bot.send_file, your_peer)
+            )
             self._initialized = True
             return True
             
@@ -89,13 +124,22 @@ class BotManager:
             ValueError: If bots are not in the group
         """
         try:
-            # Check YOUR bot
-            await self.your_bot.get_permissions(self.group_id)
-            logger.info(f"✅ {self.settings.YOUR_BOT_NAME} is in group")
+            # Resolve the group once per bot (access hashes are per account)
+            her_peer, your_peer = await asyncio.gather(
+                self.her_bot.get_input_entity(self.group_id),
+                self.your_bot.get_input_entity(self.group_id)
+            )
+            self._group_peers = (her_peer, your_peer)
             
-            # Check HER bot
-            await self.her_bot.get_permissions(self.group_id)
-            logger.info(f"✅ {self.settings.HER_BOT_NAME} is in group")
+            # Check both bots concurrently
+            await asyncio.gather(
+                self.your_bot.get_permissions(your_peer),
+                self.her_bot.get_permissions(her_peer)
+            )
+            logger.info(
+                "✅ %s and %s are in group",
+                self.settings.YOUR_BOT_NAME, self.settings.HER_BOT_NAME
+            )
             
         except Exception as e:
             logger.error(f"❌ Bots not in group. Add both bots first!")
@@ -114,7 +158,7 @@ class BotManager:
         if not self._initialized:
             raise RuntimeError("BotManager not initialized. Call initialize() first.")
         
-        return self.your_bot if is_outgoing else self.her_bot
+        return self._bots[is_outgoing]
     
     def get_sender_name(self, is_outgoing: bool) -> str:
         """
@@ -126,7 +170,7 @@ class BotManager:
         Returns:
             str: Sender's display name
         """
-        return self.settings.YOUR_NAME if is_outgoing else self.settings.HER_NAME
+        return self._names[is_outgoing]
     
     async def send_text(
         self,
@@ -145,10 +189,7 @@ class BotManager:
         Returns:
             int: Sent message ID in group
         """
-        bot = self.get_bot(is_outgoing)
-        
-        message = await bot.send_message(
-            entity=self.group_id,
+        message = await self._send_message[is_outgoing](
             message=text,
             reply_to=reply_to
         )
@@ -175,10 +216,7 @@ class BotManager:
         Returns:
             int: Sent message ID in group
         """
-        bot = self.get_bot(is_outgoing)
-        
-        message = await bot.send_message(
-            entity=self.group_id,
+        message = await self._send_message[is_outgoing](
             message=caption or "",
             file=media,
             reply_to=reply_to
@@ -189,17 +227,17 @@ class BotManager:
     
     async def send_file(
         self,
-        file_path: str,
+        file_path: Union[str, BinaryIO],
         is_outgoing: bool,
         caption: str = None,
         reply_to: int = None
     ) -> int:
         """
-        Send file from disk via appropriate bot.
+        Send file from disk or memory via appropriate bot.
         Used for view-once media.
         
         Args:
-            file_path: Path to file on disk
+            file_path: Path to file on disk, or a named file-like object
             is_outgoing: True if message is from you
             caption: Optional caption
             reply_to: Message ID to reply to (optional)
@@ -207,10 +245,7 @@ class BotManager:
         Returns:
             int: Sent message ID in group
         """
-        bot = self.get_bot(is_outgoing)
-        
-        message = await bot.send_file(
-            entity=self.group_id,
+        message = await self._send_file[is_outgoing](
             file=file_path,
             caption=caption,
             reply_to=reply_to
@@ -219,14 +254,52 @@ class BotManager:
         logger.debug(f"📤 Sent file via {self.get_sender_name(is_outgoing)}")
         return message.id
     
+    async def send_album(
+        self,
+        files: list,
+        is_outgoing: bool,
+        caption: str = None,
+        reply_to: int = None
+    ) -> list:
+        """
+        Send several files as one album via appropriate bot.
+        Uses a single request instead of one per file.
+        
+        Args:
+            files: Paths or media objects to send together
+            is_outgoing: True if message is from you
+            caption: Optional caption (shown on the album)
+            reply_to: Message ID to reply to (optional)
+            
+        Returns:
+            list: Sent message IDs in group, in album order
+        """
+        if len(files) == 1:
+            return [await self.send_file(files[0], is_outgoing, caption, reply_to)]
+        
+        messages = await self._send_file[is_outgoing](
+            file=files,
+            caption=caption,
+            reply_to=reply_to
+        )
+        
+        logger.debug(
+            f"📤 Sent album of {len(files)} via {self.get_sender_name(is_outgoing)}"
+        )
+        return [m.id for m in messages]
+    
     async def disconnect(self) -> None:
         """Disconnect both bot clients gracefully."""
-        if self.your_bot:
-            await self.your_bot.disconnect()
-            logger.info(f"🔌 {self.settings.YOUR_BOT_NAME} disconnected")
+        clients = [
+            (bot, name) for bot, name in (
+                (self.your_bot, self.settings.YOUR_BOT_NAME),
+                (self.her_bot, self.settings.HER_BOT_NAME)
+            ) if bot
+        ]
+        
+        await asyncio.gather(*(bot.disconnect() for bot, _ in clients))
         
-        if self.her_bot:
-            await self.her_bot.disconnect()
-            logger.info(f"🔌 {self.settings.HER_BOT_NAME} disconnected")
+        if clients:
+            logger.info("🔌 %s disconnected", " and ".join(name for _, name in clients))
         
         self._initialized = False
@@ -5,6 +5,7 @@ from .view_once import ViewOnceHandler
 from .edits import EditHandler
 from .deletes import DeleteHandler
 from .replies import ReplyHandler
+from .dispatcher import HandlerDispatcher
 
 __all__ = [
     "BaseHandler",
@@ -13,5 +14,6 @@ __all__ = [
     "ViewOnceHandler",
     "EditHandler",
     "DeleteHandler",
-    "ReplyHandler"
+    "ReplyHandler",
+    "HandlerDispatcher"
 ]
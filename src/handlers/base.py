@@ -1,28 +1,49 @@
 """
 Base Handler
 ============
-Abstract base class for all handlers.
+Base class for all handlers.
 Provides common functionality and interface.
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional, Any
+from functools import lru_cache
 
 from src.bots import BotManager
 from database.operations import DatabaseOperations
 from utils.logger import get_logger
 
 
-class BaseHandler(ABC):
+@lru_cache(maxsize=128)
+def _fmt_hm(hour: int, minute: int) -> str:
+    """Format hour/minute as "%I:%M %p" without strftime."""
+    return f"{(hour - 1) % 12 + 1:02d}:{minute:02d} {'PM' if hour >= 12 else 'AM'}"
+
+
+class BaseHandler:
     """
-    Abstract base class for all message handlers.
+    Base class for all message handlers.
     
     Attributes:
         bot_manager: Manager for bot clients
         db: Database operations instance
         logger: Logger instance for this handler
+    
+    Subclasses provide an ``async handle(...)`` method returning the
+    group message ID (Optional[int]); callers invoke it directly.
+    
+    Subclasses declare __slots__ for the attributes they add, so
+    handler instances carry no __dict__.
     """
     
+    __slots__ = ('bot_manager', 'db', 'logger', '_sender_names', '_sender_labels')
+    
+    # Resolved once per class, shared by all instances
+    _logger = get_logger('BaseHandler')
+    
+    def __init_subclass__(cls, **kwargs):
+        """Resolve the logger for each handler subclass once."""
+        super().__init_subclass__(**kwargs)
+        cls._logger = get_logger(cls.__name__)
+    
     def __init__(
         self,
         bot_manager: BotManager,
@@ -37,17 +58,14 @@ class BaseHandler(ABC):
         """
         self.bot_manager = bot_manager
         self.db = db
-        self.logger = get_logger(self.__class__.__name__)
-    
-    @abstractmethod
-    async def handle(self, *args, **kwargs) -> Optional[int]:
-        """
-        Handle the event. Must be implemented by subclasses.
+        self.logger = self._logger
         
-        Returns:
-            Optional[int]: Group message ID if successful
-        """
-        pass
+        # Indexed by is_outgoing: (her, yours)
+        self._sender_names = (
+            bot_manager.get_sender_name(False),
+            bot_manager.get_sender_name(True)
+        )
+        self._sender_labels = tuple(f"👤 {name}" for name in self._sender_names)
     
     def get_sender_label(self, is_outgoing: bool) -> str:
         """
@@ -59,8 +77,7 @@ class BaseHandler(ABC):
         Returns:
             str: Formatted sender label
         """
-        name = self.bot_manager.get_sender_name(is_outgoing)
-        return f"👤 {name}"
+        return self._sender_labels[is_outgoing]
     
     def get_timestamp_label(self, timestamp) -> str:
         """
@@ -72,4 +89,4 @@ class BaseHandler(ABC):
         Returns:
             str: Formatted time string
         """
-        return timestamp.strftime("%I:%M %p")
+        return _fmt_hm(timestamp.hour, timestamp.minute)
@@ -4,8 +4,11 @@ Delete Handler
 Handles message deletion detection and notification.
 """
 
+import asyncio
+import time
 from typing import Optional
 
+from database.models import MessageRow
 from .base import BaseHandler
 
 
@@ -25,31 +28,60 @@ class DeleteHandler(BaseHandler):
     """
     
     DELETE_PREFIX = "🗑️ Deleted"
+    BULK_CONCURRENCY = 16  # Max deletes in flight (flood limit safety)
+    RECENT_TTL = 300  # seconds to ignore repeated delete events
+    RECENT_MAX = 10_000  # prune expired entries beyond this size
     
-    async def handle(self, original_msg_id: int) -> Optional[int]:
+    __slots__ = ('_recent_deletes', '_pending_writes')
+    
+    def __init__(self, bot_manager, db):
+        """
+        Initialize delete handler.
+        
+        Args:
+            bot_manager: Bot manager instance
+            db: Database operations instance
+        """
+        super().__init__(bot_manager, db)
+        self._recent_deletes = {}  # original_msg_id -> monotonic time seen
+        self._pending_writes = set()
+    
+    async def handle(
+        self,
+        original_msg_id: int,
+        original: Optional[MessageRow] = None,
+        mark: bool = True
+    ) -> Optional[int]:
         """
         Handle message deletion.
         
         Args:
             original_msg_id: ID of deleted message
+            original: Prefetched message data (skips database lookup)
+            mark: Mark as deleted in database (bulk path marks in one go)
             
         Returns:
             Optional[int]: Delete notification message ID in group
         """
+        # Skip repeated delivery of an already notified delete
+        now = time.monotonic()
+        if now - self._recent_deletes.get(original_msg_id, -self.RECENT_TTL) < self.RECENT_TTL:
+            return None
+        
         try:
-            # Find original message in database
-            original = await self.db.get_message(original_msg_id)
+            # Find original message in database (unless prefetched)
+            if original is None:
+                original = await self.db.get_message(original_msg_id)
             
             if not original:
                 self.logger.debug(
-                    f"Deleted message not in database: {original_msg_id}"
+                    "Deleted message not in database: %s", original_msg_id
                 )
                 return None
             
             # Get details from database
-            group_reply_id = original.get('group_id')
-            sender = original.get('sender', 'unknown')
-            is_outgoing = sender == 'you'
+            group_reply_id = original.group_id
+            is_outgoing = original.sender == 'you'
             
             if not group_reply_id:
                 self.logger.warning("No group message ID for delete reference")
@@ -65,10 +97,16 @@ class DeleteHandler(BaseHandler):
                 reply_to=group_reply_id
             )
             
-            # Mark as deleted in database
-            await self.db.mark_deleted(original_msg_id)
+            # Only a sent notification counts; failures stay retryable
+            self._remember_delete(original_msg_id, now)
+            
+            # Mark as deleted in database (off the critical path)
+            if mark:
+                task = asyncio.create_task(self.db.mark_deleted(original_msg_id))
+                self._pending_writes.add(task)
+                task.add_done_callback(self._pending_writes.discard)
             
-            self.logger.debug(f"🗑️ Delete notification sent for: {original_msg_id}")
+            self.logger.debug("🗑️ Delete notification sent for: %s", original_msg_id)
             
             return group_msg_id
             
@@ -76,7 +114,28 @@ class DeleteHandler(BaseHandler):
             self.logger.error(f"Failed to handle delete: {e}")
             return None
     
-    def _build_delete_message(self, original: dict) -> str:
+    def _remember_delete(self, original_msg_id: int, now: float) -> None:
+        """
+        Record a notified delete so repeats within RECENT_TTL are skipped.
+        
+        Args:
+            original_msg_id: ID of deleted message
+            now: Monotonic time of the delete event
+        """
+        self._recent_deletes[original_msg_id] = now
+        
+        if len(self._recent_deletes) > self.RECENT_MAX:
+            self._recent_deletes = {
+                msg_id: seen for msg_id, seen in self._recent_deletes.items()
+                if now - seen < self.RECENT_TTL
+            }
+    
+    async def close(self) -> None:
+        """Wait for in-flight database writes to finish."""
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+    
+    def _build_delete_message(self, original: MessageRow) -> str:
         """
         Build delete notification message.
         
@@ -86,14 +145,7 @@ class DeleteHandler(BaseHandler):
         Returns:
             str: Formatted delete notification
         """
-        content_preview = original.get('content', '[Unknown content]')
-        
-        # Truncate if too long
-        if len(content_preview) > 100:
-            content_preview = content_preview[:100] + "..."
-        
-        has_media = original.get('has_media', False)
-        media_label = " [Had Media]" if has_media else ""
+        media_label = " [Had Media]" if original.has_media else ""
         
         return f"{self.DELETE_PREFIX}{media_label}"
     
@@ -107,11 +159,27 @@ class DeleteHandler(BaseHandler):
         Returns:
             int: Number of successfully handled deletions
         """
-        success_count = 0
+        # Fetch all originals in one query
+        originals = await self.db.get_messages(message_ids)
+        
+        semaphore = asyncio.Semaphore(self.BULK_CONCURRENCY)
+        
+        async def handle_one(msg_id: int) -> Optional[int]:
+            async with semaphore:
+                return await self.handle(msg_id, originals[msg_id], mark=False)
+        
+        results = await asyncio.gather(
+            *(handle_one(msg_id) for msg_id in originals),
+            return_exceptions=True
+        )
+        
+        handled = [
+            msg_id for msg_id, result in zip(originals, results)
+            if isinstance(result, int)
+        ]
         
-        for msg_id in message_ids:
-            result = await self.handle(msg_id)
-            if result:
-                success_count += 1
+        # Mark all handled deletes in one update
+        if handled:
+            await self.db.mark_deleted_many(handled)
         
-        return success_count
+        return len(handled)
@@ -0,0 +1,97 @@
+"""
+Handler Dispatcher
+==================
+Decouples Telegram event receiving from handler processing.
+Events are queued and processed by a pool of worker tasks.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class HandlerDispatcher:
+    """
+    Bounded queue between event callbacks and handler workers.
+    
+    Event callbacks only enqueue, so the Telethon receive loop keeps
+    draining updates while workers pipeline database and bot I/O.
+    A full queue makes callbacks wait (backpressure).
+    
+    Note:
+        With more than one worker, events may finish out of order.
+    """
+    
+    def __init__(self, workers: int = 4, maxsize: int = 256):
+        """
+        Initialize dispatcher.
+        
+        Args:
+            workers: Number of worker tasks
+            maxsize: Maximum queued events before callbacks wait
+        """
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.worker_count = workers
+        self._routes: Dict[str, Callable[..., Awaitable]] = {}
+        self._workers: List[asyncio.Task] = []
+    
+    def register(self, kind: str, handler: Callable[..., Awaitable]) -> None:
+        """
+        Register coroutine function for an event kind.
+        
+        Args:
+            kind: Event kind (e.g. 'message', 'edit')
+            handler: Coroutine function called with the queued args
+        """
+        self._routes[kind] = handler
+    
+    def start(self) -> None:
+        """Start worker tasks."""
+        if self._workers:
+            return
+        
+        self._workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(self.worker_count)
+        ]
+        logger.debug(f"🧵 Dispatcher started with {self.worker_count} workers")
+    
+    async def put(self, kind: str, *args) -> None:
+        """
+        Queue an event for processing.
+        
+        Args:
+            kind: Registered event kind
+            *args: Arguments passed to the handler
+        """
+        await self.queue.put((kind, args))
+    
+    async def _worker(self) -> None:
+        """Process queued events until cancelled."""
+        while True:
+            kind, args = await self.queue.get()
+            
+            try:
+                await self._routes[kind](*args)
+            except Exception as e:
+                logger.error(f"❌ Dispatch of '{kind}' failed: {e}")
+            finally:
+                self.queue.task_done()
+    
+    async def stop(self) -> None:
+        """Drain queued events, then stop workers."""
+        if not self._workers:
+            return
+        
+        await self.queue.join()
+        
+        for task in self._workers:
+            task.cancel()
+        
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        
+        logger.debug("🧵 Dispatcher stopped")
@@ -4,6 +4,7 @@ Edit Handler
 Handles message edit detection and notification.
 """
 
+import asyncio
 from typing import Optional
 from telethon.tl.types import Message
 
@@ -26,6 +27,23 @@ class EditHandler(BaseHandler):
     """
     
     EDIT_PREFIX = "✏️ Edited"
+    FLUSH_INTERVAL = 0.2  # seconds to gather edits before writing
+    FLUSH_SIZE = 50  # write immediately once this many are buffered
+    
+    __slots__ = ('_edit_buf', '_flush_event', '_flush_task')
+    
+    def __init__(self, bot_manager, db):
+        """
+        Initialize edit handler and its write-behind buffer.
+        
+        Args:
+            bot_manager: Bot manager instance
+            db: Database operations instance
+        """
+        super().__init__(bot_manager, db)
+        self._edit_buf = []
+        self._flush_event = asyncio.Event()
+        self._flush_task = asyncio.create_task(self._flusher())
     
     async def handle(
         self,
@@ -53,15 +71,16 @@ class EditHandler(BaseHandler):
                 return None
             
             # Get the group message ID to reply to
-            group_reply_id = original.get('group_id')
+            group_reply_id = original.group_id
             
             if not group_reply_id:
                 self.logger.warning("No group message ID for edit reference")
                 return None
             
             # Build edit notification
-            sender_name = self.bot_manager.get_sender_name(is_outgoing)
-            edit_text = self._build_edit_message(msg, sender_name)
+            text = msg.text
+            sender_name = self._sender_names[is_outgoing]
+            edit_text = self._build_edit_message(text, sender_name)
             
             # Send edit notification via bot
             group_msg_id = await self.bot_manager.send_text(
@@ -70,14 +89,11 @@ class EditHandler(BaseHandler):
                 reply_to=group_reply_id
             )
             
-            # Update edit history in database
-            await self.db.add_edit(
-                original_id=msg.id,
-                new_content=msg.text,
-                edit_notification_id=group_msg_id
-            )
+            # Queue edit history for the next batched write
+            self._edit_buf.append((msg.id, text, group_msg_id))
+            self._flush_event.set()
             
-            self.logger.debug(f"✏️ Edit notification sent for: {msg.id}")
+            self.logger.debug("✏️ Edit notification sent for: %s", msg.id)
             
             return group_msg_id
             
@@ -85,18 +101,53 @@ class EditHandler(BaseHandler):
             self.logger.error(f"Failed to handle edit: {e}")
             return None
     
-    def _build_edit_message(self, msg: Message, sender_name: str) -> str:
+    async def _flusher(self) -> None:
+        """Write buffered edits in batches until cancelled."""
+        while True:
+            await self._flush_event.wait()
+            
+            if len(self._edit_buf) < self.FLUSH_SIZE:
+                await asyncio.sleep(self.FLUSH_INTERVAL)
+            
+            self._flush_event.clear()
+            await self.flush()
+    
+    async def flush(self) -> int:
+        """
+        Write all buffered edits to the database.
+        
+        Returns:
+            int: Number of edits saved
+        """
+        if not self._edit_buf:
+            return 0
+        
+        batch, self._edit_buf = self._edit_buf, []
+        return await self.db.add_edits_many(batch)
+    
+    async def close(self) -> None:
+        """Stop the background writer and flush remaining edits."""
+        self._flush_task.cancel()
+        
+        try:
+            await self._flush_task
+        except asyncio.CancelledError:
+            pass
+        
+        await self.flush()
+    
+    def _build_edit_message(self, text: Optional[str], sender_name: str) -> str:
         """
         Build edit notification message.
         
         Args:
-            msg: Edited message
+            text: Edited message text
             sender_name: Name of who edited
             
         Returns:
             str: Formatted edit notification
         """
-        new_text = msg.text or "[Media caption edited]"
+        new_text = text or "[Media caption edited]"
         
         return f"{self.EDIT_PREFIX}:\n\n{new_text}"
     
@@ -119,26 +170,38 @@ class EditHandler(BaseHandler):
         edits_found = 0
         
         try:
-            async for msg in self.bot_manager.your_bot.iter_messages(
-                chat_id,
-                limit=limit
-            ):
-                # Get stored version
-                stored = await self.db.get_message(msg.id)
+            msgs = [
+                msg async for msg in self.bot_manager.your_bot.iter_messages(
+                    chat_id,
+                    limit=limit
+                )
+            ]
+            
+            # Get all stored versions in one query
+            stored_map = await self.db.get_messages([msg.id for msg in msgs])
+            
+            edited = []
+            for msg in msgs:
+                stored = stored_map.get(msg.id)
                 
                 if not stored:
                     continue
                 
                 # Compare content
-                stored_content = stored.get('content', '')
+                stored_content = stored.content
                 current_content = msg.text or ''
                 
                 if stored_content != current_content:
                     self.logger.info(f"🔍 Offline edit detected: {msg.id}")
-                    
-                    # Process as edit
-                    await self.handle(msg, msg.out)
-                    edits_found += 1
+                    edited.append(msg)
+            
+            edits_found = len(edited)
+            
+            # Process all edits concurrently
+            await asyncio.gather(
+                *(self.handle(msg, msg.out) for msg in edited),
+                return_exceptions=True
+            )
             
             return edits_found
             
@@ -10,6 +10,7 @@ Handlers:
     - EditHandler: Message edits
     - DeleteHandler: Message deletions
     - ReplyHandler: Reply chain management
+    - HandlerDispatcher: Queue between events and handlers
 """
 
 from .messages import MessageHandler
@@ -18,6 +19,7 @@ from .view_once import ViewOnceHandler
 from .edits import EditHandler
 from .deletes import DeleteHandler
 from .replies import ReplyHandler
+from .dispatcher import HandlerDispatcher
 
 __all__ = [
     "MessageHandler",
@@ -25,5 +27,6 @@ __all__ = [
     "ViewOnceHandler",
     "EditHandler",
     "DeleteHandler",
-    "ReplyHandler"
+    "ReplyHandler",
+    "HandlerDispatcher"
 ]
@@ -1,49 +1,197 @@
-from typing import Optional
-from telethon.tl.types import Message
+from typing import Optional, List, Dict
+from telethon.tl.types import (
+    Message,
+    InputPhoto,
+    MessageMediaPhoto,
+    MessageMediaDocument,
+    MessageMediaContact,
+    MessageMediaGeo,
+    MessageMediaGeoLive,
+    MessageMediaVenue,
+    MessageMediaPoll,
+    DocumentAttributeSticker,
+    DocumentAttributeAnimated,
+    DocumentAttributeVideo,
+    DocumentAttributeAudio
+)
+from database.models import MediaType
+from utils.helpers import run_blocking, unlink_batch
 from .base import BaseHandler
+import asyncio
+import io
 import os
 
+# Media class -> type for everything that isn't a document
+_MEDIA_TYPES = {
+    MessageMediaPhoto: MediaType.PHOTO,
+    MessageMediaContact: MediaType.CONTACT,
+    MessageMediaGeo: MediaType.LOCATION,
+    MessageMediaGeoLive: MediaType.LOCATION,
+    MessageMediaVenue: MediaType.LOCATION,
+    MessageMediaPoll: MediaType.POLL
+}
+
+# Media send_file() can re-send; anything else (web page previews,
+# games, invoices, ...) goes straight to the forward fallback
+_SENDABLE_MEDIA = (MessageMediaDocument, *_MEDIA_TYPES)
+
 class MediaHandler(BaseHandler):
+    __slots__ = ('monitor',)
+
     def __init__(self, bot_manager, db, monitor_client):
         super().__init__(bot_manager, db)
         self.monitor = monitor_client
+        os.makedirs("temp", exist_ok=True)
 
     async def handle(self, msg: Message, is_outgoing: bool, reply_to_group_id: Optional[int] = None) -> Optional[int]:
+        text = msg.text or ""
         try:
             # PHOTOS: Download & send via bot (for bot name display)
             if msg.photo:
-                os.makedirs("temp", exist_ok=True)
-                path = await self.monitor.download_media(msg, file=f"temp/photo_{msg.id}.jpg")
-                if path:
-                    bot = self.bot_manager.get_bot(is_outgoing)
+                bot = self.bot_manager.get_bot(is_outgoing)
+                sender = 'you' if is_outgoing else 'her'
+                
+                # Reuse this bot's earlier upload of the same photo (no download)
+                cached = await self.db.get_media_cache(msg.photo.id, sender)
+                if cached:
+                    try:
+                        sent = await bot.send_file(
+                            entity=self.bot_manager.group_id,
+                            file=InputPhoto(
+                                cached['file_id'],
+                                cached['access_hash'],
+                                cached['file_reference']
+                            ),
+                            caption=text,
+                            reply_to=reply_to_group_id
+                        )
+                        return sent.id
+                    except Exception as e:
+                        self.logger.debug("Cached photo unusable, re-uploading: %s", e)
+                
+                # Download into memory, no temp file round-trip
+                buf = io.BytesIO()
+                if await self.monitor.download_media(msg, file=buf):
+                    buf.seek(0)
+                    buf.name = f"photo_{msg.id}.jpg"  # Telethon infers type from name
                     sent = await bot.send_file(
                         entity=self.bot_manager.group_id,
-                        file=path,
-                        caption=msg.text or "",
+                        file=buf,
+                        caption=text,
                         reply_to=reply_to_group_id
                     )
-                    os.remove(path)
+                    if sent.photo:
+                        await self.db.save_media_cache(
+                            msg.photo.id,
+                            sender,
+                            sent.photo.id,
+                            sent.photo.access_hash,
+                            sent.photo.file_reference
+                        )
                     return sent.id
             
-            # VIDEOS/DOCS: Forward using YOUR account (INSTANT!)
+            # VIDEOS/DOCS: Re-send using YOUR account (INSTANT!) with sender label as caption
             else:
-                # Forward instantly via your account
-                forwarded = await self.monitor.send_message(
-                    entity=self.bot_manager.group_id,
-                    message=msg  # This forwards the entire message including media!
-                )
+                if not isinstance(msg.media, _SENDABLE_MEDIA):
+                    return await self._fallback_forward(msg, is_outgoing)
                 
-                # Add label via bot
-                bot = self.bot_manager.get_bot(is_outgoing)
-                sender = self.bot_manager.get_sender_name(is_outgoing)
-                await bot.send_message(
-                    entity=self.bot_manager.group_id,
-                    message=f"👤 {sender}",
-                    reply_to=forwarded.id
-                )
+                label = self._sender_labels[is_outgoing]
+                try:
+                    sent = await self.monitor.send_file(
+                        entity=self.bot_manager.group_id,
+                        file=msg.media,
+                        caption=f"{label}\n{text}" if text else label,
+                        reply_to=reply_to_group_id
+                    )
+                    return sent.id
+                except Exception as e:
+                    self.logger.debug("Captioned send failed, forwarding with label: %s", e)
                 
-                return forwarded.id
+                return await self._fallback_forward(msg, is_outgoing)
             
         except Exception as e:
             self.logger.error(f"Media error: {e}")
             return None
+
+    async def _fallback_forward(self, msg: Message, is_outgoing: bool) -> int:
+        # Forward instantly via your account
+        forwarded = await self.monitor.send_message(
+            entity=self.bot_manager.group_id,
+            message=msg  # This forwards the entire message including media!
+        )
+        
+        # Add label via bot
+        bot = self.bot_manager.get_bot(is_outgoing)
+        await bot.send_message(
+            entity=self.bot_manager.group_id,
+            message=self._sender_labels[is_outgoing],
+            reply_to=forwarded.id
+        )
+        
+        return forwarded.id
+
+    async def handle_album(self, messages: List[Message], is_outgoing: bool, reply_to_group_id: Optional[int] = None) -> Dict[int, int]:
+        sent = []
+        try:
+            # ALBUMS: Download all items concurrently, send back as one album.
+            # A failed item is dropped; the rest still go out (and get cleaned up)
+            results = await asyncio.gather(*(
+                self.monitor.download_media(m, file="temp/") for m in messages
+            ), return_exceptions=True)
+            
+            for m, result in zip(messages, results):
+                if isinstance(result, str):
+                    sent.append((m, result))
+                elif isinstance(result, BaseException):
+                    self.logger.warning(f"Album item {m.id} download failed: {result}")
+            
+            if not sent:
+                return {}
+            
+            caption = next((m.text for m in messages if m.text), "")
+            group_ids = await self.bot_manager.send_album(
+                [p for _, p in sent],
+                is_outgoing,
+                caption=caption,
+                reply_to=reply_to_group_id
+            )
+            
+            return {m.id: gid for (m, _), gid in zip(sent, group_ids)}
+            
+        except Exception as e:
+            self.logger.error(f"Album error: {e}")
+            return {}
+            
+        finally:
+            if sent:
+                await run_blocking(
+                    unlink_batch, "temp", [os.path.basename(p) for _, p in sent]
+                )
+
+    @staticmethod
+    def get_media_type(msg: Message) -> MediaType:
+        media_type = _MEDIA_TYPES.get(type(msg.media))
+        if media_type:
+            return media_type
+        if not isinstance(msg.media, MessageMediaDocument):
+            return MediaType.NONE
+        
+        # Documents: one pass over attributes (stickers/GIFs also carry video attrs)
+        animated = False
+        video = audio = None
+        for attr in getattr(msg.media.document, 'attributes', ()):
+            if isinstance(attr, DocumentAttributeSticker):
+                return MediaType.STICKER
+            if isinstance(attr, DocumentAttributeAnimated):
+                animated = True
+            elif isinstance(attr, DocumentAttributeVideo):
+                video = attr
+            elif isinstance(attr, DocumentAttributeAudio):
+                audio = attr
+        if animated:
+            return MediaType.GIF
+        if video:
+            return MediaType.VIDEO_NOTE if video.round_message else MediaType.VIDEO
+        if audio:
+            return MediaType.VOICE if audio.voice else MediaType.AUDIO
+        return MediaType.DOCUMENT
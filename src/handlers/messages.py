@@ -4,6 +4,7 @@ Message Handler
 Handles text messages (no media).
 """
 
+import logging
 from typing import Optional
 from telethon.tl.types import Message
 
@@ -20,6 +21,8 @@ class MessageHandler(BaseHandler):
         - Handle formatted text (bold, italic, etc.)
     """
     
+    __slots__ = ()
+    
     async def handle(
         self,
         msg: Message,
@@ -52,9 +55,10 @@ class MessageHandler(BaseHandler):
                 reply_to=reply_to_group_id
             )
             
-            self.logger.debug(
-                f"📝 Text sent: {text[:50]}{'...' if len(text) > 50 else ''}"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "📝 Text sent: %s%s", text[:50], '...' if len(text) > 50 else ''
+                )
             
             return group_msg_id
             
@@ -1,12 +1,21 @@
+from collections import OrderedDict
 from typing import Optional
 from .base import BaseHandler
 
 class ReplyHandler(BaseHandler):
+    GID_CACHE_MAX = 4096
+
+    __slots__ = ('_gid_cache',)
+
+    def __init__(self, bot_manager, db):
+        super().__init__(bot_manager, db)
+        self._gid_cache = OrderedDict()  # original_msg_id -> group_id (LRU)
+
     async def handle(self, msg, is_outgoing: bool, original_reply_id: int) -> Optional[int]:
         try:
             group_reply_id = await self.get_group_reply_id(original_reply_id)
             if group_reply_id:
-                self.logger.debug(f"Reply chain: {original_reply_id} → {group_reply_id}")
+                self.logger.debug("Reply chain: %s → %s", original_reply_id, group_reply_id)
             return group_reply_id
         except Exception as e:
             self.logger.error(f"Failed to handle reply: {e}")
@@ -14,10 +23,25 @@ class ReplyHandler(BaseHandler):
 
     async def get_group_reply_id(self, original_msg_id: int) -> Optional[int]:
         try:
+            group_id = self._gid_cache.get(original_msg_id)
+            if group_id:
+                self._gid_cache.move_to_end(original_msg_id)
+                return group_id
             message_data = await self.db.get_message(original_msg_id)
             if message_data:
-                return message_data.get('group_id')
+                group_id = message_data.group_id
+                if group_id:
+                    self.remember(original_msg_id, group_id)
+                return group_id
             return None
         except Exception as e:
             self.logger.error(f"Failed to get group reply ID: {e}")
             return None
+
+    def remember(self, original_msg_id: int, group_id: Optional[int]) -> None:
+        if not group_id:
+            return
+        self._gid_cache[original_msg_id] = group_id
+        self._gid_cache.move_to_end(original_msg_id)
+        if len(self._gid_cache) > self.GID_CACHE_MAX:
+            self._gid_cache.popitem(last=False)
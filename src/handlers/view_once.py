@@ -5,13 +5,15 @@ Handles self-destructing (view-once) media.
 MUST download first, then send as regular media.
 """
 
+import io
 import os
 import asyncio
-from typing import Optional
+from typing import List, Optional
 from telethon.tl.types import Message
 
 from .base import BaseHandler
-from utils.media_utils import get_temp_path, cleanup_temp
+from utils.media_utils import get_temp_path
+from utils.helpers import RateLimiter, run_blocking
 
 
 class ViewOnceHandler(BaseHandler):
@@ -20,15 +22,21 @@ class ViewOnceHandler(BaseHandler):
     
     Flow:
         1. Detect view-once media
-        2. Download immediately to temp folder
+        2. Download immediately (in memory, or temp folder if large)
         3. Send as regular media via bot
-        4. Delete temp file
+        4. Delete temp file, if any
     
     Note:
         Downloading view-once marks it as "seen" in the original chat.
     """
     
     VIEW_ONCE_CAPTION = "🔥 View-Once"
+    MEMORY_LIMIT = 50 * 1024 * 1024  # Larger media goes through a temp file
+    DOWNLOAD_WORKERS = 4
+    PART_SIZE = 512 * 1024  # Largest part Telegram serves per request
+    PARALLEL_DOWNLOAD = hasattr(os, 'pwrite')  # Not available on Windows
+    
+    __slots__ = ('monitor', '_captions', '_cleanup_q', '_janitor_task')
     
     def __init__(self, bot_manager, db, monitor_client):
         """
@@ -41,6 +49,16 @@ class ViewOnceHandler(BaseHandler):
         """
         super().__init__(bot_manager, db)
         self.monitor = monitor_client
+        
+        # Indexed by is_outgoing: (her, yours)
+        self._captions = tuple(
+            f"{self.VIEW_ONCE_CAPTION} from {name}"
+            for name in self._sender_names
+        )
+        
+        # Temp files are deleted off the hot path, in batches
+        self._cleanup_q: asyncio.Queue = asyncio.Queue()
+        self._janitor_task = asyncio.create_task(self._janitor())
     
     async def handle(
         self,
@@ -62,37 +80,45 @@ class ViewOnceHandler(BaseHandler):
         temp_path = None
         
         try:
-            # Generate temp file path
-            temp_path = get_temp_path(msg.id)
+            self.logger.info("🔥 Downloading view-once media: %s", msg.id)
             
-            self.logger.info(f"🔥 Downloading view-once media: {msg.id}")
+            # Keep media in memory unless it's large (or of unknown size)
+            size = msg.file.size if msg.file else None
+            if size and size <= self.MEMORY_LIMIT:
+                target = io.BytesIO()
+            else:
+                target = temp_path = get_temp_path(msg.id, msg.file.ext if msg.file else None)
             
             # Download media using monitor account
-            downloaded_path = await self.monitor.download_media(
-                message=msg,
-                file=temp_path
-            )
+            if temp_path and size and self.PARALLEL_DOWNLOAD:
+                downloaded = await self._parallel_download(msg, temp_path, size)
+            else:
+                downloaded = await self.monitor.download_media(
+                    message=msg,
+                    file=target
+                )
             
-            if not downloaded_path or not os.path.exists(downloaded_path):
+            if not downloaded:
                 self.logger.error("Failed to download view-once media")
                 return None
             
+            if temp_path is None:
+                target.seek(0)
+                target.name = f"view_once_{msg.id}{msg.file.ext or ''}"  # Telethon infers type from name
+                downloaded = target
+            
             # Determine media type
             media_type = self._get_view_once_type(msg)
             
-            # Build caption
-            sender_name = self.bot_manager.get_sender_name(is_outgoing)
-            caption = f"{self.VIEW_ONCE_CAPTION} from {sender_name}"
-            
             # Send via appropriate bot
             group_msg_id = await self.bot_manager.send_file(
-                file_path=downloaded_path,
+                file_path=downloaded,
                 is_outgoing=is_outgoing,
-                caption=caption,
+                caption=self._captions[is_outgoing],
                 reply_to=reply_to_group_id
             )
             
-            self.logger.info(f"✅ View-once {media_type} saved: {msg.id}")
+            self.logger.info("✅ View-once %s saved: %s", media_type, msg.id)
             
             return group_msg_id
             
@@ -101,9 +127,112 @@ class ViewOnceHandler(BaseHandler):
             return None
             
         finally:
-            # Always cleanup temp file
+            # Always cleanup temp file (queued for the janitor)
             if temp_path:
-                cleanup_temp(temp_path)
+                self._cleanup_q.put_nowait(temp_path)
+    
+    async def _janitor(self) -> None:
+        """Delete queued temp files in batches until cancelled."""
+        while True:
+            paths = [await self._cleanup_q.get()]
+            while not self._cleanup_q.empty():
+                paths.append(self._cleanup_q.get_nowait())
+            
+            try:
+                await run_blocking(self._unlink_many, paths)
+            finally:
+                for _ in paths:
+                    self._cleanup_q.task_done()
+    
+    def _unlink_many(self, paths: List[str]) -> None:
+        """
+        Delete files, ignoring ones that are already gone.
+        
+        Args:
+            paths: File paths to delete
+        """
+        for path in paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.error(f"Failed to delete {path}: {e}")
+    
+    async def close(self) -> None:
+        """Delete remaining temp files and stop the janitor."""
+        await self._cleanup_q.join()
+        self._janitor_task.cancel()
+        
+        try:
+            await self._janitor_task
+        except asyncio.CancelledError:
+            pass
+    
+    async def _parallel_download(
+        self,
+        msg: Message,
+        path: str,
+        size: int
+    ) -> str:
+        """
+        Download media with several concurrent part requests.
+        
+        Each worker fetches a contiguous range of parts and writes them
+        at their offsets in a pre-sized file.
+        
+        Args:
+            msg: Telethon message with media
+            path: Destination file path
+            size: Media size in bytes
+            
+        Returns:
+            str: Destination file path
+        """
+        parts = -(-size // self.PART_SIZE)
+        per_worker = -(-parts // self.DOWNLOAD_WORKERS)
+        
+        fd = await run_blocking(os.open, path, os.O_RDWR | os.O_CREAT, 0o600)
+        tasks: List[asyncio.Task] = []
+        writes = set()
+        
+        try:
+            await run_blocking(os.ftruncate, fd, size)
+            
+            async def fetch(first_part: int) -> None:
+                offset = first_part * self.PART_SIZE
+                async for chunk in self.monitor.iter_download(
+                    msg,
+                    offset=offset,
+                    request_size=self.PART_SIZE,
+                    limit=per_worker
+                ):
+                    # Writes run in a thread so slow disks don't stall the
+                    # loop; shielded so cancelling a fetch can't orphan one
+                    write = asyncio.ensure_future(
+                        run_blocking(os.pwrite, fd, chunk, offset)
+                    )
+                    writes.add(write)
+                    write.add_done_callback(writes.discard)
+                    await asyncio.shield(write)
+                    offset += len(chunk)
+            
+            tasks = [
+                asyncio.create_task(fetch(first_part))
+                for first_part in range(0, parts, per_worker)
+            ]
+            await asyncio.gather(*tasks)
+            
+            return path
+            
+        finally:
+            # One fetch failed (or we were cancelled): stop the others and
+            # let in-flight writes land before the fd number is reused
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, *writes, return_exceptions=True)
+            
+            await run_blocking(os.close, fd)
     
     def _get_view_once_type(self, msg: Message) -> str:
         """
@@ -138,27 +267,12 @@ class ViewOnceHandler(BaseHandler):
         Returns:
             bool: True if view-once media
         """
-        if not msg.media:
-            return False
-        
-        # Check for TTL (time-to-live) attribute
         media = msg.media
+        if media is None:
+            return False
         
-        # Direct ttl_seconds check
-        if hasattr(media, 'ttl_seconds') and media.ttl_seconds is not None:
-            return True
-        
-        # Check photo
-        if hasattr(media, 'photo') and media.photo:
-            if hasattr(media, 'ttl_seconds') and media.ttl_seconds:
-                return True
-        
-        # Check document
-        if hasattr(media, 'document') and media.document:
-            if hasattr(media, 'ttl_seconds') and media.ttl_seconds:
-                return True
-        
-        return False
+        # Self-destructing photos and videos carry a TTL
+        return getattr(media, 'ttl_seconds', None) is not None
 
 
 class ViewOnceRecovery:
@@ -167,6 +281,9 @@ class ViewOnceRecovery:
     when bot starts after being offline.
     """
     
+    CONCURRENCY = 4  # View-once media recovered at once
+    RATE = 2  # Recoveries started per second
+    
     def __init__(self, handler: ViewOnceHandler):
         """
         Initialize recovery utility.
@@ -176,6 +293,30 @@ class ViewOnceRecovery:
         """
         self.handler = handler
         self.logger = handler.logger
+        self.limiter = RateLimiter(rate=self.RATE)
+    
+    async def _recover_one(
+        self,
+        msg: Message,
+        slots: asyncio.Semaphore
+    ) -> Optional[int]:
+        """
+        Handle one unopened view-once and free its slot.
+        
+        Args:
+            msg: Telethon message with view-once media
+            slots: Semaphore acquired by recover_unopened()
+            
+        Returns:
+            Optional[int]: Sent message ID in group
+        """
+        try:
+            return await self.handler.handle(
+                msg=msg,
+                is_outgoing=msg.out
+            )
+        finally:
+            slots.release()
     
     async def recover_unopened(
         self,
@@ -193,29 +334,36 @@ class ViewOnceRecovery:
             int: Number of recovered view-once media
         """
         recovered = 0
+        slots = asyncio.Semaphore(self.CONCURRENCY)
+        tasks = []
         
         try:
-            async for msg in self.handler.monitor.iter_messages(
-                chat_id,
-                limit=limit
-            ):
-                # Check if view-once and not yet processed
-                if ViewOnceHandler.is_view_once(msg):
-                    exists = await self.handler.db.message_exists(msg.id)
-                    
-                    if not exists:
-                        self.logger.info(f"🔍 Found unopened view-once: {msg.id}")
-                        
-                        result = await self.handler.handle(
-                            msg=msg,
-                            is_outgoing=msg.out
-                        )
-                        
-                        if result:
-                            recovered += 1
-                        
-                        # Small delay to avoid rate limiting
-                        await asyncio.sleep(0.5)
+            candidates = [
+                msg async for msg in self.handler.monitor.iter_messages(
+                    chat_id,
+                    limit=limit
+                )
+                if ViewOnceHandler.is_view_once(msg)
+            ]
+            
+            # Check all candidates in one query
+            existing = await self.handler.db.messages_existing(
+                [msg.id for msg in candidates]
+            )
+            
+            for msg in candidates:
+                if msg.id in existing:
+                    continue
+                
+                self.logger.info("🔍 Found unopened view-once: %s", msg.id)
+                
+                # Bounded concurrency and send rate
+                await self.limiter.acquire()
+                await slots.acquire()
+                tasks.append(asyncio.create_task(self._recover_one(msg, slots)))
+            
+            results = await asyncio.gather(*tasks)
+            recovered = sum(1 for result in results if result)
             
             return recovered
             
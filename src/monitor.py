@@ -6,16 +6,23 @@ and coordinates forwarding to backup group.
 """
 
 import asyncio
+from typing import Iterable, Optional, Set
 from telethon import TelegramClient, events
-from telethon.tl.types import (
-    MessageMediaPhoto,
-    MessageMediaDocument
-)
 
 from config.settings import Settings
 from database.operations import DatabaseOperations
 from utils.logger import get_logger
+from utils.helpers import RateLimiter
 from .bots import BotManager
+from .handlers import (
+    MessageHandler,
+    MediaHandler,
+    ViewOnceHandler,
+    EditHandler,
+    DeleteHandler,
+    ReplyHandler,
+    HandlerDispatcher
+)
 
 logger = get_logger(__name__)
 
@@ -31,6 +38,16 @@ class Monitor:
         settings: Configuration settings
     """
     
+    SAVE_QUEUE_SIZE = 1024
+    SAVE_BATCH_SIZE = 100
+    SAVE_BATCH_WINDOW = 0.05  # seconds to wait for more messages
+    LAST_ID_FLUSH_INTERVAL = 5.0  # seconds between progress writes
+    CATCHUP_RATE = 2  # Missed messages reposted per second
+    CATCHUP_BURST = 5
+    CATCHUP_PAGE_SIZE = 100  # Telegram's max messages per history request
+    DISPATCH_WORKERS = 4
+    DISPATCH_QUEUE_SIZE = 128  # Events queued before Telethon callbacks wait
+    
     def __init__(self, settings: Settings):
         """
         Initialize monitor with settings.
@@ -44,8 +61,31 @@ class Monitor:
         self.db: DatabaseOperations = None
         self._running = False
         
-        # Import handlers here to avoid circular imports
+        # Created in _setup_handlers()
         self.handlers = None
+        self.dispatcher = None
+        self._message_handler = None
+        self._media_handler = None
+        self._view_once_handler = None
+        self._edit_handler = None
+        self._delete_handler = None
+        self._reply_handler = None
+        
+        # Message saves are batched by a background writer
+        self._save_queue: asyncio.Queue = asyncio.Queue(maxsize=self.SAVE_QUEUE_SIZE)
+        self._db_writer_task: asyncio.Task = None
+        self._pending_saves: Set[int] = set()
+        
+        # Last processed message ID, tracked in memory. It only moves
+        # past messages that are saved, so a restart retries any that
+        # were still queued or failed.
+        self._resume_from: Optional[int] = None
+        self._last_id: Optional[int] = None
+        self._last_id_saved: Optional[int] = None
+        self._last_id_flushed_at = 0.0
+        self._saved_max: Optional[int] = None
+        self._unsaved: Set[int] = set()
+        self._catchup_frontier: Optional[int] = None
     
     async def initialize(self) -> bool:
         """
@@ -73,6 +113,11 @@ class Monitor:
             self.db = DatabaseOperations(self.settings.MONGO_URI)
             await self.db.connect()
             
+            # Catch-up resumes from here, whatever live events do meanwhile
+            self._resume_from = await self.db.get_last_processed_id()
+            self._last_id = self._last_id_saved = self._resume_from
+            self._saved_max = self._resume_from
+            
             # Setup handlers
             await self._setup_handlers()
             
@@ -84,15 +129,6 @@ class Monitor:
     
     async def _setup_handlers(self) -> None:
         """Register all event handlers."""
-        from src.handlers import (
-            MessageHandler,
-            MediaHandler,
-            ViewOnceHandler,
-            EditHandler,
-            DeleteHandler,
-            ReplyHandler
-        )
-        
         # Initialize handlers with dependencies
         self.handlers = {
             'message': MessageHandler(self.bot_manager, self.db),
@@ -103,43 +139,74 @@ class Monitor:
             'reply': ReplyHandler(self.bot_manager, self.db)
         }
         
+        # Bound once so the hot paths skip the dict lookup
+        self._message_handler = self.handlers['message']
+        self._media_handler = self.handlers['media']
+        self._view_once_handler = self.handlers['view_once']
+        self._edit_handler = self.handlers['edit']
+        self._delete_handler = self.handlers['delete']
+        self._reply_handler = self.handlers['reply']
+        
+        # Event callbacks only enqueue; workers do the processing
+        self.dispatcher = HandlerDispatcher(
+            workers=self.DISPATCH_WORKERS,
+            maxsize=self.DISPATCH_QUEUE_SIZE
+        )
+        self.dispatcher.register('message', self._handle_new_message)
+        self.dispatcher.register('album', self._handle_album)
+        self.dispatcher.register('edit', self._handle_edit)
+        self.dispatcher.register('delete', self._handle_delete)
+        self.dispatcher.start()
+        
+        self._db_writer_task = asyncio.create_task(self._db_writer())
+        
         # Register new message handler
         @self.client.on(events.NewMessage(chats=self.settings.HER_USER_ID))
         async def on_new_message(event):
-            await self._handle_new_message(event)
+            # Album items are handled together by on_album
+            msg = event.message
+            if msg.grouped_id:
+                return
+            self._unsaved.add(msg.id)
+            await self.dispatcher.put('message', msg)
+        
+        # Register album handler (media groups arrive as one event)
+        @self.client.on(events.Album(chats=self.settings.HER_USER_ID))
+        async def on_album(event):
+            self._unsaved.update(msg.id for msg in event.messages)
+            await self.dispatcher.put('album', event)
         
         # Register edit handler
         @self.client.on(events.MessageEdited(chats=self.settings.HER_USER_ID))
         async def on_message_edited(event):
-            await self._handle_edit(event)
+            await self.dispatcher.put('edit', event)
         
         # Register delete handler
         @self.client.on(events.MessageDeleted(chats=self.settings.HER_USER_ID))
         async def on_message_deleted(event):
-            await self._handle_delete(event)
+            await self.dispatcher.put('delete', event)
         
         logger.info("✅ Event handlers registered")
     
-    async def _handle_new_message(self, event) -> None:
+    async def _handle_new_message(self, msg) -> None:
         """
         Handle new incoming/outgoing message.
         
         Args:
-            event: Telethon new message event
+            msg: Telethon message object
         """
         try:
-            msg = event.message
             is_outgoing = msg.out
             
             # Check if view-once media
             if self._is_view_once(msg):
-                group_msg_id = await self.handlers['view_once'].handle(
+                group_msg_id = await self._view_once_handler.handle(
                     msg, is_outgoing
                 )
             
             # Check if has media
             elif msg.media:
-                group_msg_id = await self.handlers['media'].handle(
+                group_msg_id = await self._media_handler.handle(
                     msg, is_outgoing
                 )
             
@@ -148,29 +215,165 @@ class Monitor:
                 # Check if it's a reply
                 reply_to_group_id = None
                 if msg.reply_to_msg_id:
-                    reply_to_group_id = await self.handlers['reply'].get_group_reply_id(
+                    reply_to_group_id = await self._reply_handler.get_group_reply_id(
                         msg.reply_to_msg_id
                     )
                 
-                group_msg_id = await self.handlers['message'].handle(
+                group_msg_id = await self._message_handler.handle(
                     msg, is_outgoing, reply_to_group_id
                 )
             
             # Save to database
-            await self.db.save_message(
+            await self._queue_save(
                 original_id=msg.id,
                 group_id=group_msg_id,
                 sender='you' if is_outgoing else 'her',
                 content=msg.text or "[Media]",
                 has_media=bool(msg.media),
+                media_type=self._media_handler.get_media_type(msg),
                 reply_to_original=msg.reply_to_msg_id
             )
             
-            logger.info(f"✅ Message {msg.id} → {group_msg_id}")
+            logger.info("✅ Message %s → %s", msg.id, group_msg_id)
             
         except Exception as e:
             logger.error(f"❌ Error handling message: {e}")
     
+    async def _handle_album(self, event) -> None:
+        """
+        Handle a media group (album) as a single send.
+        
+        Args:
+            event: Telethon album event
+        """
+        try:
+            messages = event.messages
+            first = messages[0]
+            is_outgoing = first.out
+            
+            # Check if it's a reply
+            reply_to_group_id = None
+            if first.reply_to_msg_id:
+                reply_to_group_id = await self._reply_handler.get_group_reply_id(
+                    first.reply_to_msg_id
+                )
+            
+            group_ids = await self._media_handler.handle_album(
+                messages, is_outgoing, reply_to_group_id
+            )
+            
+            # Save each album item to database
+            for msg in messages:
+                await self._queue_save(
+                    original_id=msg.id,
+                    group_id=group_ids.get(msg.id),
+                    sender='you' if is_outgoing else 'her',
+                    content=msg.text or "[Media]",
+                    has_media=True,
+                    media_type=self._media_handler.get_media_type(msg),
+                    reply_to_original=msg.reply_to_msg_id
+                )
+            
+            logger.info("✅ Album of %d → %s", len(messages), list(group_ids.values()))
+            
+        except Exception as e:
+            logger.error(f"❌ Error handling album: {e}")
+    
+    async def _queue_save(self, **fields) -> None:
+        """
+        Queue a message for the background database writer.
+        
+        Args:
+            **fields: save_message() keyword arguments
+        """
+        # Replies to this message may arrive before the batch is written
+        self._reply_handler.remember(fields['original_id'], fields['group_id'])
+        
+        try:
+            self._save_queue.put_nowait(fields)
+            self._pending_saves.add(fields['original_id'])
+        except asyncio.QueueFull:
+            # Writer is behind; save directly rather than drop
+            self._mark_saved(await self.db.save_messages_bulk([fields]))
+    
+    async def _db_writer(self) -> None:
+        """Write queued messages to the database in batches."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._save_queue.get()]
+            deadline = loop.time() + self.SAVE_BATCH_WINDOW
+            
+            # Collect whatever else arrives within the window
+            while len(batch) < self.SAVE_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._save_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                self._mark_saved(await self.db.save_messages_bulk(batch))
+                
+                # Progress is persisted periodically, not per batch
+                if loop.time() - self._last_id_flushed_at >= self.LAST_ID_FLUSH_INTERVAL:
+                    await self._persist_last_id()
+                    self._last_id_flushed_at = loop.time()
+                    
+            except Exception as e:
+                logger.error(f"❌ Failed to write {len(batch)} messages: {e}")
+            finally:
+                for fields in batch:
+                    self._pending_saves.discard(fields['original_id'])
+                    self._save_queue.task_done()
+    
+    def _mark_saved(self, original_ids: Iterable[int]) -> None:
+        """
+        Advance the last processed ID over newly saved messages.
+        
+        It stops below the oldest message still queued or failed, and
+        below the catch-up frontier while catch-up is running.
+        
+        Args:
+            original_ids: IDs now stored in the database
+        """
+        original_ids = list(original_ids)
+        if not original_ids:
+            return
+        
+        self._unsaved.difference_update(original_ids)
+        self._saved_max = max(self._saved_max or 0, *original_ids)
+        
+        last_id = self._saved_max
+        if self._unsaved:
+            last_id = min(last_id, min(self._unsaved) - 1)
+        if self._catchup_frontier is not None:
+            last_id = min(last_id, self._catchup_frontier)
+        
+        if last_id > (self._last_id or 0):
+            self._last_id = last_id
+    
+    async def _persist_last_id(self) -> None:
+        """Save the in-memory last processed ID if it has advanced."""
+        if self._last_id and self._last_id != self._last_id_saved:
+            if await self.db.update_last_processed_id(self._last_id):
+                self._last_id_saved = self._last_id
+    
+    async def _wait_for_saves(self, original_ids: Iterable[int]) -> None:
+        """
+        Wait until queued saves of these messages are written.
+        
+        Edits and deletes read the saved row; one arriving within the
+        batch window would otherwise find nothing.
+        
+        Args:
+            original_ids: Message IDs about to be looked up
+        """
+        if not self._pending_saves.isdisjoint(original_ids):
+            await self._save_queue.join()
+    
     async def _handle_edit(self, event) -> None:
         """
         Handle message edit event.
@@ -182,8 +385,9 @@ class Monitor:
             msg = event.message
             is_outgoing = msg.out
             
-            await self.handlers['edit'].handle(msg, is_outgoing)
-            logger.info(f"✏️ Edit detected: {msg.id}")
+            await self._wait_for_saves((msg.id,))
+            await self._edit_handler.handle(msg, is_outgoing)
+            logger.info("✏️ Edit detected: %s", msg.id)
             
         except Exception as e:
             logger.error(f"❌ Error handling edit: {e}")
@@ -196,41 +400,22 @@ class Monitor:
             event: Telethon message deleted event
         """
         try:
-            for msg_id in event.deleted_ids:
-                await self.handlers['delete'].handle(msg_id)
-                logger.info(f"🗑️ Delete detected: {msg_id}")
-                
+            # Replayed updates can repeat ids
+            deleted_ids = list(dict.fromkeys(event.deleted_ids))
+            if not deleted_ids:
+                return
+            
+            await self._wait_for_saves(deleted_ids)
+            
+            # One lookup and one update for the whole event
+            handled = await self._delete_handler.handle_bulk_delete(deleted_ids)
+            logger.info("🗑️ Deletes detected: %d/%d", handled, len(deleted_ids))
+            
         except Exception as e:
             logger.error(f"❌ Error handling delete: {e}")
     
-    def _is_view_once(self, msg) -> bool:
-        """
-        Check if message contains view-once media.
-        
-        Args:
-            msg: Telethon message object
-            
-        Returns:
-            bool: True if view-once media
-        """
-        if not msg.media:
-            return False
-        
-        # Check for TTL (self-destructing)
-        if hasattr(msg.media, 'ttl_seconds') and msg.media.ttl_seconds:
-            return True
-        
-        # Check photo
-        if isinstance(msg.media, MessageMediaPhoto):
-            if hasattr(msg.media, 'ttl_seconds') and msg.media.ttl_seconds:
-                return True
-        
-        # Check document/video
-        if isinstance(msg.media, MessageMediaDocument):
-            if hasattr(msg.media, 'ttl_seconds') and msg.media.ttl_seconds:
-                return True
-        
-        return False
+    # Shared with the view-once handler: one ttl_seconds read per message
+    _is_view_once = staticmethod(ViewOnceHandler.is_view_once)
     
     async def catch_up(self) -> None:
         """
@@ -240,8 +425,8 @@ class Monitor:
         logger.info("🔄 Checking for missed messages...")
         
         try:
-            # Get last processed message ID from database
-            last_id = await self.db.get_last_processed_id()
+            # Last processed message ID, loaded at startup
+            last_id = self._resume_from
             
             if not last_id:
                 logger.info("📭 No previous messages found. Starting fresh.")
@@ -249,24 +434,25 @@ class Monitor:
             
             logger.info(f"📍 Last processed: {last_id}")
             
-            # Fetch all messages after last_id
-            missed_count = 0
+            # Live messages can't move the last processed ID past what
+            # catch-up has fetched so far
+            self._catchup_frontier = last_id
             
-            async for msg in self.client.iter_messages(
-                self.settings.HER_USER_ID,
-                min_id=last_id,
-                reverse=True  # Chronological order
-            ):
-                # Skip if already processed
-                if await self.db.message_exists(msg.id):
-                    continue
-                
-                # Create fake event for handler
-                event = type('Event', (), {'message': msg})()
-                await self._handle_new_message(event)
+            # Fetch pages in the background while missed messages are handled
+            queue: asyncio.Queue = asyncio.Queue(maxsize=2 * self.CATCHUP_PAGE_SIZE)
+            producer = asyncio.create_task(self._fetch_missed(last_id, queue))
+            
+            try:
+                missed_count = await self._catch_up_worker(queue)
                 
-                missed_count += 1
-                await asyncio.sleep(0.5)  # Rate limit protection
+                # Every missed message is now queued or saved
+                if await producer:
+                    self._catchup_frontier = None
+            finally:
+                # Cancelled or failed: don't leave the producer behind
+                if not producer.done():
+                    producer.cancel()
+                    await asyncio.gather(producer, return_exceptions=True)
             
             if missed_count > 0:
                 logger.info(f"✅ Caught up {missed_count} missed messages")
@@ -276,6 +462,84 @@ class Monitor:
         except Exception as e:
             logger.error(f"❌ Catch up failed: {e}")
     
+    async def _fetch_missed(self, last_id: int, queue: asyncio.Queue) -> bool:
+        """
+        Queue messages after last_id that aren't in the database yet.
+        
+        Args:
+            last_id: Last processed message ID
+            queue: Queue drained by _catch_up_worker()
+            
+        Returns:
+            bool: True if the whole history was fetched
+        """
+        async def queue_page(page: list) -> None:
+            # Skip already processed messages, one query per page
+            existing = await self.db.messages_existing([msg.id for msg in page])
+            for msg in page:
+                if msg.id not in existing:
+                    self._unsaved.add(msg.id)
+                    await queue.put(msg)
+            
+            self._catchup_frontier = page[-1].id
+        
+        page = []
+        complete = False
+        
+        try:
+            async for msg in self.client.iter_messages(
+                self.settings.HER_USER_ID,
+                min_id=last_id,
+                reverse=True,  # Chronological order
+                wait_time=0
+            ):
+                page.append(msg)
+                if len(page) >= self.CATCHUP_PAGE_SIZE:
+                    await queue_page(page)
+                    page = []
+            
+            if page:
+                await queue_page(page)
+            
+            complete = True
+            
+        except asyncio.CancelledError:
+            # Consumer is gone; a stop marker could block on a full queue
+            raise
+        except Exception as e:
+            logger.error(f"❌ Fetching missed messages failed: {e}")
+        
+        # Stop marker
+        await queue.put(None)
+        return complete
+    
+    async def _catch_up_worker(self, queue: asyncio.Queue) -> int:
+        """
+        Handle queued missed messages until the stop marker.
+        
+        Messages are handled one at a time in id order, so they are
+        reposted chronologically and a reply's parent is always sent
+        (and remembered) before the reply itself.
+        
+        Args:
+            queue: Queue filled by _fetch_missed()
+            
+        Returns:
+            int: Number of messages handled
+        """
+        handled = 0
+        
+        # Token bucket instead of a fixed sleep: time spent handling a
+        # message counts toward the wait for the next one
+        limiter = RateLimiter(rate=self.CATCHUP_RATE, burst=self.CATCHUP_BURST)
+        
+        while (msg := await queue.get()) is not None:
+            await limiter.acquire()
+            await self._handle_new_message(msg)
+            handled += 1
+        
+        return handled
+    
     async def run(self) -> None:
         """Start the monitor and run until disconnected."""
         if not self.client:
@@ -298,6 +562,24 @@ class Monitor:
         """Stop the monitor gracefully."""
         self._running = False
         
+        # Finish queued events before tearing down clients
+        if self.dispatcher:
+            await self.dispatcher.stop()
+        
+        # Flush queued message saves
+        if self._db_writer_task:
+            await self._save_queue.join()
+            self._db_writer_task.cancel()
+            await asyncio.gather(self._db_writer_task, return_exceptions=True)
+            self._db_writer_task = None
+            await self._persist_last_id()
+        
+        # Write buffered/pending history before closing the database
+        if self.handlers:
+            await self.handlers['edit'].close()
+            await self.handlers['delete'].close()
+            await self.handlers['view_once'].close()
+        
         if self.bot_manager:
             await self.bot_manager.disconnect()
         
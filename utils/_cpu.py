@@ -0,0 +1,58 @@
+"""
+CPU Capabilities
+================
+Instruction-set detection, done once at import.
+Hot paths branch on the cached booleans instead of probing the CPU.
+"""
+
+from typing import FrozenSet
+
+# Portable fallback for platforms without /proc/cpuinfo
+try:
+    import cpuinfo
+except ImportError:
+    cpuinfo = None
+
+
+def _detect() -> FrozenSet[str]:
+    """
+    Collect CPU feature flags.
+    
+    Reads /proc/cpuinfo (Linux, Android/Termux) and falls back to
+    py-cpuinfo elsewhere.
+    
+    Returns:
+        FrozenSet[str]: Lower-case flag names (empty if unknown)
+    """
+    try:
+        with open('/proc/cpuinfo', encoding='ascii', errors='ignore') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                # x86 calls it "flags", ARM "Features"
+                if key.strip() in ('flags', 'Features'):
+                    return frozenset(value.lower().split())
+    except OSError:
+        pass
+    
+    if cpuinfo:
+        try:
+            return frozenset(cpuinfo.get_cpu_info().get('flags', ()))
+        except Exception:
+            pass
+    
+    return frozenset()
+
+
+CAPS: FrozenSet[str] = _detect()
+
+HAS_SSE42 = 'sse4_2' in CAPS
+HAS_AVX2 = 'avx2' in CAPS
+HAS_AVX512 = 'avx512f' in CAPS
+HAS_NEON = 'asimd' in CAPS or 'neon' in CAPS
+HAS_AES = 'aes' in CAPS
+
+# x86 SHA extensions ("sha_ni" in /proc, "sha" in py-cpuinfo), ARMv8 "sha2"
+HAS_SHANI = bool(CAPS & {'sha_ni', 'sha', 'sha2'})
+
+# Wide vector units: BLAKE3 and xxh3 run at full speed
+HAS_WIDE_SIMD = HAS_AVX2 or HAS_NEON
@@ -7,10 +7,15 @@ Performance-optimized and production-ready.
 
 import os
 import re
+import fnmatch
+import sys
+import random
 import asyncio
 import time
 import psutil
 import functools
+from collections import deque
+from itertools import islice
 from typing import (
     Optional, 
     Union, 
@@ -19,9 +24,10 @@ from typing import (
     Callable, 
     TypeVar, 
     List,
-    Tuple
+    Tuple,
+    Deque
 )
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from pathlib import Path
 
 import phonenumbers
@@ -35,9 +41,35 @@ logger = get_logger(__name__)
 T = TypeVar('T')
 AsyncFunc = TypeVar('AsyncFunc', bound=Callable)
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+_DURATION_FORMATS = (
+    "{s}s", "{s}s", "{m}m", "{m}m {s}s",
+    "{h}h", "{h}h {s}s", "{h}h {m}m", "{h}h {m}m {s}s"
+)
+
+_TIMESTAMP_FORMATS = {
+    "full": "%Y-%m-%d %H:%M:%S",
+    "date": "%Y-%m-%d",
+    "time": "%H:%M:%S"
+}
+
+# Filename sanitizing: invalid characters -> '_', control characters removed
+_SANITIZE_TABLE = str.maketrans(
+    {**dict.fromkeys(range(32)), **dict.fromkeys('<>:"/\\|?*', '_')}
+)
+
+_TG_ID_MAX = 10**15
+
+# Precompiled patterns
+_TG_LINK_PREFIXES = ('https://t.me/', 'http://t.me/')
+_TG_PUBLIC = re.compile(r"https?://t\.me/([^/]+)/(\d+)")
+_TG_PRIVATE = re.compile(r"https?://t\.me/c/(\d+)/(\d+)")
+
 
 # ==================== FORMATTING UTILITIES ====================
 
+@functools.lru_cache(maxsize=1024)
 def format_file_size(bytes_size: int) -> str:
     """
     Format bytes to human-readable size.
@@ -54,14 +86,12 @@ def format_file_size(bytes_size: int) -> str:
         >>> format_file_size(1048576)
         '1.0 MB'
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024.0:
-            if unit == 'B':
-                return f"{bytes_size:.0f} {unit}"
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024.0
+    if bytes_size < 1024:
+        return f"{bytes_size:.0f} B"
     
-    return f"{bytes_size:.1f} PB"
+    # Each unit is 10 bits: pick it straight from the bit length
+    index = min((int(bytes_size).bit_length() - 1) // 10, 5)
+    return f"{bytes_size / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
 
 
 def format_duration(seconds: Union[int, float]) -> str:
@@ -80,22 +110,22 @@ def format_duration(seconds: Union[int, float]) -> str:
         >>> format_duration(45)
         '45s'
     """
+    # Only whole seconds are shown, so cache on the int
+    return _format_duration(int(seconds))
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_duration(seconds: int) -> str:
+    """Cached body of format_duration()."""
     if seconds < 60:
-        return f"{int(seconds)}s"
-    
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+        return f"{seconds}s"
     
-    parts = []
-    if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0:
-        parts.append(f"{minutes}m")
-    if secs > 0 or not parts:
-        parts.append(f"{secs}s")
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
     
-    return " ".join(parts)
+    # Template keyed by which of hours/minutes/seconds are non-zero
+    key = (hours > 0) << 2 | (minutes > 0) << 1 | (secs > 0)
+    return _DURATION_FORMATS[key].format(h=hours, m=minutes, s=secs)
 
 
 def format_timestamp(
@@ -112,20 +142,22 @@ def format_timestamp(
     Returns:
         str: Formatted timestamp
     """
-    if format_type == "full":
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
-    elif format_type == "date":
-        return dt.strftime("%Y-%m-%d")
-    elif format_type == "time":
-        return dt.strftime("%H:%M:%S")
-    elif format_type == "relative":
-        delta = datetime.utcnow() - dt
-        if delta.days > 0:
-            return f"{delta.days}d ago"
-        elif delta.seconds > 3600:
-            return f"{delta.seconds // 3600}h ago"
-        elif delta.seconds > 60:
-            return f"{delta.seconds // 60}m ago"
+    fmt = _TIMESTAMP_FORMATS.get(format_type)
+    if fmt:
+        return dt.strftime(fmt)
+    
+    if format_type == "relative":
+        # Naive datetimes are UTC (utcnow) throughout the project
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        
+        seconds = int(time.time() - dt.timestamp())
+        if seconds >= 86400:
+            return f"{seconds // 86400}d ago"
+        elif seconds > 3600:
+            return f"{seconds // 3600}h ago"
+        elif seconds > 60:
+            return f"{seconds // 60}m ago"
         else:
             return "just now"
     
@@ -149,11 +181,8 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
         >>> sanitize_filename("my/file<name>.txt")
         'my_file_name_.txt'
     """
-    # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    
-    # Remove control characters
-    filename = ''.join(char for char in filename if ord(char) >= 32)
+    # Replace invalid and remove control characters in one pass
+    filename = filename.translate(_SANITIZE_TABLE)
     
     # Truncate if too long
     if len(filename) > max_length:
@@ -185,19 +214,12 @@ def validate_telegram_id(user_id: Union[str, int]) -> Tuple[bool, Optional[int]]
         (False, None)
     """
     try:
-        # Convert to int
+        # Convert to int (int() itself rejects non-numeric strings)
         if isinstance(user_id, str):
-            # Remove @ if present
-            user_id = user_id.lstrip('@')
-            
-            # Check if numeric
-            if not user_id.lstrip('-').isdigit():
-                return False, None
-            
-            user_id = int(user_id)
+            user_id = int(user_id.lstrip('@'))
         
         # Telegram IDs are 32-bit or 64-bit integers
-        if abs(user_id) > 10**15:
+        if abs(user_id) > _TG_ID_MAX:
             return False, None
         
         return True, user_id
@@ -206,6 +228,7 @@ def validate_telegram_id(user_id: Union[str, int]) -> Tuple[bool, Optional[int]]
         return False, None
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_phone_number(
     phone: str, 
     region: str = None
@@ -267,8 +290,11 @@ def get_message_link(
         'https://t.me/mychannel/123'
     """
     if is_private:
-        # Private chats use different format
-        return f"https://t.me/c/{str(chat_id).lstrip('-100')}/{message_id}"
+        # Private chats use different format, without the -100 prefix
+        chat_id = str(chat_id)
+        if chat_id.startswith('-100'):
+            chat_id = chat_id[4:]
+        return f"https://t.me/c/{chat_id}/{message_id}"
     
     # Public channel/group
     chat_id = str(chat_id).lstrip('@')
@@ -285,27 +311,25 @@ def parse_telegram_link(url: str) -> Optional[Dict[str, Any]]:
     Returns:
         Optional[Dict]: Parsed components or None
     """
-    # Pattern for public channels
-    public_pattern = r"https?://t\.me/([^/]+)/(\d+)"
+    # Cheap rejection of anything that isn't a t.me link
+    if not url.startswith(_TG_LINK_PREFIXES):
+        return None
     
-    # Pattern for private channels
-    private_pattern = r"https?://t\.me/c/(\d+)/(\d+)"
-    
-    # Try public pattern
-    match = re.match(public_pattern, url)
+    # Try private pattern first ("c" would also match as a public chat)
+    match = _TG_PRIVATE.match(url)
     if match:
         return {
-            "type": "public",
-            "chat": match.group(1),
+            "type": "private",
+            "chat_id": f"-100{match.group(1)}",
             "message_id": int(match.group(2))
         }
     
-    # Try private pattern
-    match = re.match(private_pattern, url)
+    # Try public pattern
+    match = _TG_PUBLIC.match(url)
     if match:
         return {
-            "type": "private",
-            "chat_id": f"-100{match.group(1)}",
+            "type": "public",
+            "chat": match.group(1),
             "message_id": int(match.group(2))
         }
     
@@ -318,7 +342,8 @@ def retry_async(
     max_attempts: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
-    exceptions: Tuple[type, ...] = (Exception,)
+    exceptions: Tuple[type, ...] = (Exception,),
+    jitter: float = 0.1
 ) -> Callable:
     """
     Decorator for retrying async functions with exponential backoff.
@@ -328,6 +353,7 @@ def retry_async(
         delay: Initial delay between retries
         backoff: Backoff multiplier
         exceptions: Exceptions to catch
+        jitter: Random fraction (+/-) applied to each delay
         
     Returns:
         Decorated function
@@ -352,16 +378,20 @@ def retry_async(
                     
                     if attempt == max_attempts:
                         logger.error(
-                            f"{func.__name__} failed after {max_attempts} attempts: {e}"
+                            "%s failed after %d attempts: %s",
+                            func.__name__, max_attempts, e
                         )
                         raise
                     
+                    # Spread retries so concurrent callers don't retry in lockstep
+                    sleep_for = current_delay * (1 + random.uniform(-jitter, jitter))
+                    
                     logger.warning(
-                        f"{func.__name__} attempt {attempt} failed, "
-                        f"retrying in {current_delay:.1f}s..."
+                        "%s attempt %d failed, retrying in %.1fs...",
+                        func.__name__, attempt, sleep_for
                     )
                     
-                    await asyncio.sleep(current_delay)
+                    await asyncio.sleep(sleep_for)
                     current_delay *= backoff
             
             raise last_exception
@@ -370,6 +400,26 @@ def retry_async(
     return decorator
 
 
+async def run_blocking(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a blocking call in the default thread pool.
+    
+    Equivalent to asyncio.to_thread(), which needs Python 3.9+.
+    
+    Args:
+        func: Blocking function
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+        
+    Returns:
+        Whatever func returns
+    """
+    if kwargs:
+        func = functools.partial(func, **kwargs)
+    
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
 # ==================== RATE LIMITING ====================
 
 class RateLimiter:
@@ -378,9 +428,13 @@ class RateLimiter:
     
     Features:
         - Token bucket algorithm
-        - Async-safe
+        - Async-safe without a lock (single event loop)
         - Configurable burst size
         - Auto-refill
+    
+    Usage:
+        async with limiter:             # one token
+        async with limiter(tokens=3):   # several tokens
     """
     
     def __init__(
@@ -402,7 +456,6 @@ class RateLimiter:
         self.burst = burst or rate
         self.tokens = self.burst
         self.last_refill = time.monotonic()
-        self._lock = asyncio.Lock()
     
     async def acquire(self, tokens: int = 1) -> float:
         """
@@ -414,16 +467,19 @@ class RateLimiter:
         Returns:
             float: Time waited in seconds
         """
-        async with self._lock:
-            wait_time = await self._acquire_tokens(tokens)
-            
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
-                wait_time = await self._acquire_tokens(tokens)
+        waited = 0.0
+        
+        # No lock needed: bucket updates never span an await. Other
+        # callers may take the refilled tokens while we sleep, so retry.
+        while True:
+            wait_time = self._acquire_tokens(tokens)
+            if wait_time <= 0:
+                return waited
             
-            return wait_time
+            await asyncio.sleep(wait_time)
+            waited += wait_time
     
-    async def _acquire_tokens(self, tokens: int) -> float:
+    def _acquire_tokens(self, tokens: int) -> float:
         """
         Internal method to acquire tokens.
         
@@ -432,7 +488,16 @@ class RateLimiter:
             
         Returns:
             float: Wait time if tokens not available
+            
+        Raises:
+            ValueError: If more tokens are requested than the bucket holds
         """
+        # Would otherwise wait forever: the bucket never exceeds burst
+        if tokens > self.burst:
+            raise ValueError(
+                f"Requested {tokens} tokens but burst is {self.burst}"
+            )
+        
         # Refill tokens based on time passed
         now = time.monotonic()
         elapsed = now - self.last_refill
@@ -453,14 +518,40 @@ class RateLimiter:
         
         return wait_time
     
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """
+        Acquire tokens only if available right now, without waiting.
+        
+        Args:
+            tokens: Number of tokens to acquire
+            
+        Returns:
+            bool: True if tokens were acquired
+        """
+        return self._acquire_tokens(tokens) <= 0
+    
     @property
     def available_tokens(self) -> float:
         """Get current available tokens."""
         return self.tokens
     
+    def __call__(self, tokens: int = 1) -> '_RateLimitContext':
+        """
+        Context manager that acquires several tokens on entry.
+        
+        Args:
+            tokens: Number of tokens to acquire
+            
+        Returns:
+            Async context manager bound to this limiter
+        """
+        return _RateLimitContext(self, tokens)
+    
     async def __aenter__(self):
         """Async context manager entry."""
-        await self.acquire()
+        # Fast path: no coroutine call when a token is already available
+        if not self.try_acquire():
+            await self.acquire()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -468,6 +559,24 @@ class RateLimiter:
         pass
 
 
+class _RateLimitContext:
+    """`async with limiter(tokens=n)` helper for RateLimiter."""
+    
+    __slots__ = ('limiter', 'tokens')
+    
+    def __init__(self, limiter: RateLimiter, tokens: int):
+        self.limiter = limiter
+        self.tokens = tokens
+    
+    async def __aenter__(self) -> RateLimiter:
+        if not self.limiter.try_acquire(self.tokens):
+            await self.limiter.acquire(self.tokens)
+        return self.limiter
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
 # ==================== TIME TRACKING ====================
 
 class TimeTracker:
@@ -488,9 +597,14 @@ class TimeTracker:
             name: Tracker name for identification
         """
         self.name = name
-        self.times: List[float] = []
         self.start_time: Optional[float] = None
         self.current_elapsed: float = 0.0
+        
+        # Running statistics (no per-call history)
+        self._count = 0
+        self._total = 0.0
+        self._min = 0.0
+        self._max = 0.0
     
     def start(self) -> 'TimeTracker':
         """Start timing."""
@@ -507,10 +621,17 @@ class TimeTracker:
         if self.start_time is None:
             raise RuntimeError("Timer not started")
         
-        self.current_elapsed = time.perf_counter() - self.start_time
-        self.times.append(self.current_elapsed)
+        elapsed = self.current_elapsed = time.perf_counter() - self.start_time
         self.start_time = None
         
+        if self._count:
+            self._min = min(self._min, elapsed)
+            self._max = max(self._max, elapsed)
+        else:
+            self._min = self._max = elapsed
+        self._count += 1
+        self._total += elapsed
+        
         return self.current_elapsed
     
     @property
@@ -523,25 +644,28 @@ class TimeTracker:
     @property
     def average(self) -> float:
         """Get average execution time."""
-        if not self.times:
+        if not self._count:
             return 0.0
-        return sum(self.times) / len(self.times)
+        return self._total / self._count
     
     @property
     def total(self) -> float:
         """Get total execution time."""
-        return sum(self.times)
+        return self._total
     
     @property
     def count(self) -> int:
         """Get number of measurements."""
-        return len(self.times)
+        return self._count
     
     def reset(self) -> None:
         """Reset all measurements."""
-        self.times.clear()
         self.start_time = None
         self.current_elapsed = 0.0
+        self._count = 0
+        self._total = 0.0
+        self._min = 0.0
+        self._max = 0.0
     
     def stats(self) -> Dict[str, float]:
         """
@@ -550,18 +674,9 @@ class TimeTracker:
         Returns:
             Dict with min, max, average, total times
         """
-        if not self.times:
-            return {
-                "min": 0.0,
-                "max": 0.0,
-                "average": 0.0,
-                "total": 0.0,
-                "count": 0
-            }
-        
         return {
-            "min": min(self.times),
-            "max": max(self.times),
+            "min": self._min,
+            "max": self._max,
             "average": self.average,
             "total": self.total,
             "count": self.count
@@ -578,7 +693,7 @@ class TimeTracker:
     
     def __str__(self) -> str:
         """String representation."""
-        if self.times:
+        if self._count:
             return f"TimeTracker({self.name}): {self.average:.3f}s avg, {self.count} calls"
         return f"TimeTracker({self.name}): No measurements"
 
@@ -596,6 +711,8 @@ class MemoryMonitor:
         - Threshold alerts
     """
     
+    MAX_MEASUREMENTS = 100
+    
     def __init__(
         self,
         threshold_mb: float = 500.0,
@@ -611,25 +728,86 @@ class MemoryMonitor:
         self.threshold_bytes = threshold_mb * 1024 * 1024
         self.check_interval = check_interval
         self.process = psutil.Process()
-        self.measurements: List[Dict[str, Any]] = []
+        self._memory_info = self.process.memory_info
+        self._virtual_memory = psutil.virtual_memory
+        self.measurements: Deque[Dict[str, Any]] = deque(maxlen=self.MAX_MEASUREMENTS)
+        self._rss: Deque[float] = deque(maxlen=self.MAX_MEASUREMENTS)  # rss_mb column
         self._monitoring = False
         self._task: Optional[asyncio.Task] = None
+        
+        # Linux: /proc files pread while monitoring, instead of psutil
+        self._statm_fd: Optional[int] = None
+        self._meminfo_fd: Optional[int] = None
+    
+    def _open_proc_files(self) -> None:
+        """Open the /proc files behind the Linux fast path."""
+        if not sys.platform.startswith('linux') or self._statm_fd is not None:
+            return
+        
+        try:
+            self._page_size = os.sysconf('SC_PAGE_SIZE')
+            self._total_bytes = psutil.virtual_memory().total
+            self._meminfo_fd = os.open('/proc/meminfo', os.O_RDONLY)
+            self._statm_fd = os.open('/proc/self/statm', os.O_RDONLY)
+        except (OSError, ValueError):
+            self._close_proc_files()
+    
+    def _close_proc_files(self) -> None:
+        """Close the /proc files; get_memory_info() falls back to psutil."""
+        for fd in (self._statm_fd, self._meminfo_fd):
+            if fd is not None:
+                os.close(fd)
+        
+        self._statm_fd = self._meminfo_fd = None
     
     def get_memory_info(self) -> Dict[str, Any]:
         """
         Get current memory information.
         
         Returns:
-            Dict with memory statistics
+            Dict with memory statistics ("timestamp" is Unix time)
         """
-        mem_info = self.process.memory_info()
+        if self._statm_fd is not None:
+            try:
+                return self._read_proc_memory()
+            except (OSError, ValueError):
+                pass  # Fall back to psutil
+        
+        mem_info = self._memory_info()
+        virtual = self._virtual_memory()
         
         return {
             "rss_mb": mem_info.rss / (1024 * 1024),
             "vms_mb": mem_info.vms / (1024 * 1024),
-            "percent": self.process.memory_percent(),
-            "available_mb": psutil.virtual_memory().available / (1024 * 1024),
-            "timestamp": datetime.utcnow()
+            "percent": mem_info.rss / virtual.total * 100,  # As memory_percent(), without re-reading
+            "available_mb": virtual.available / (1024 * 1024),
+            "timestamp": time.time()
+        }
+    
+    def _read_proc_memory(self) -> Dict[str, Any]:
+        """
+        Get current memory information from /proc (Linux fast path).
+        
+        Returns:
+            Dict with memory statistics, same keys as get_memory_info()
+        """
+        # statm: size resident ... (in pages)
+        vms_pages, rss_pages = os.pread(self._statm_fd, 128, 0).split()[:2]
+        rss = int(rss_pages) * self._page_size
+        vms = int(vms_pages) * self._page_size
+        
+        available_kb = 0
+        for line in os.pread(self._meminfo_fd, 4096, 0).splitlines():
+            if line.startswith(b'MemAvailable:'):
+                available_kb = int(line.split()[1])
+                break
+        
+        return {
+            "rss_mb": rss / (1024 * 1024),
+            "vms_mb": vms / (1024 * 1024),
+            "percent": rss / self._total_bytes * 100,
+            "available_mb": available_kb / 1024,
+            "timestamp": time.time()
         }
     
     async def start_monitoring(self) -> None:
@@ -639,6 +817,7 @@ class MemoryMonitor:
             return
         
         self._monitoring = True
+        self._open_proc_files()
         self._task = asyncio.create_task(self._monitor_loop())
         logger.info("🔍 Memory monitoring started")
     
@@ -654,6 +833,7 @@ class MemoryMonitor:
             except asyncio.CancelledError:
                 pass
         
+        self._close_proc_files()
         logger.info("🛑 Memory monitoring stopped")
     
     async def _monitor_loop(self) -> None:
@@ -661,16 +841,13 @@ class MemoryMonitor:
         while self._monitoring:
             try:
                 info = self.get_memory_info()
-                self.measurements.append(info)
-                
-                # Keep only last 100 measurements
-                if len(self.measurements) > 100:
-                    self.measurements.pop(0)
+                self.measurements.append(info)  # Oldest drops off at maxlen
+                self._rss.append(info["rss_mb"])
                 
                 # Check threshold
                 if info["rss_mb"] * 1024 * 1024 > self.threshold_bytes:
                     logger.warning(
-                        f"⚠️ Memory threshold exceeded: {info['rss_mb']:.1f} MB"
+                        "⚠️ Memory threshold exceeded: %.1f MB", info['rss_mb']
                     )
                 
                 # Check for potential leak (continuous growth)
@@ -680,7 +857,7 @@ class MemoryMonitor:
                 await asyncio.sleep(self.check_interval)
                 
             except Exception as e:
-                logger.error(f"Memory monitoring error: {e}")
+                logger.error("Memory monitoring error: %s", e)
                 await asyncio.sleep(self.check_interval)
     
     def _detect_leak(self, window_size: int = 10) -> bool:
@@ -693,16 +870,16 @@ class MemoryMonitor:
         Returns:
             bool: True if potential leak detected
         """
-        if len(self.measurements) < window_size:
+        if len(self._rss) < window_size:
             return False
         
-        recent = self.measurements[-window_size:]
+        recent = list(islice(self._rss, len(self._rss) - window_size, None))
         
         # Check if memory is continuously increasing
-        increasing_count = 0
-        for i in range(1, len(recent)):
-            if recent[i]["rss_mb"] > recent[i-1]["rss_mb"]:
-                increasing_count += 1
+        increasing_count = sum(
+            later > earlier
+            for earlier, later in zip(recent, recent[1:])
+        )
         
         # If 80% of measurements show increase, possible leak
         return increasing_count > (window_size * 0.8)
@@ -717,7 +894,7 @@ class MemoryMonitor:
         if not self.measurements:
             return {"error": "No measurements available"}
         
-        rss_values = [m["rss_mb"] for m in self.measurements]
+        rss_values = self._rss
         
         return {
             "current_mb": rss_values[-1],
@@ -772,21 +949,68 @@ def cleanup_old_files(
     Returns:
         int: Number of files deleted
     """
-    directory = Path(directory)
-    cutoff = datetime.now() - timedelta(days=days)
-    deleted = 0
+    cutoff = time.time() - days * 86400  # Compared with raw st_mtime
+    matches = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+    expired = []
     
-    for file in directory.glob(pattern):
-        if file.is_file():
-            # Check file age
-            mtime = datetime.fromtimestamp(file.stat().st_mtime)
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return 0
+    
+    # DirEntry caches file type, so no extra stat per name
+    with entries:
+        for entry in entries:
+            if not entry.is_file() or not matches(os.path.normcase(entry.name)):
+                continue
             
-            if mtime < cutoff:
-                try:
-                    file.unlink()
-                    deleted += 1
-                    logger.debug(f"Deleted old file: {file}")
-                except Exception as e:
-                    logger.error(f"Failed to delete {file}: {e}")
+            # Check file age
+            if entry.stat().st_mtime < cutoff:
+                expired.append(entry.name)
+    
+    return unlink_batch(directory, expired)
+
+
+def unlink_batch(directory: Union[str, Path], names: List[str]) -> int:
+    """
+    Delete files from one directory in a single batch.
+    
+    The directory is opened once and each file removed with unlinkat()
+    relative to it, so the kernel does not re-resolve the full path
+    per file. Falls back to plain unlink() where dir_fd is unsupported.
+    
+    Args:
+        directory: Directory containing the files
+        names: File names (not paths) to delete
+        
+    Returns:
+        int: Number of files deleted
+    """
+    if not names:
+        return 0
+    
+    dir_fd = None
+    if os.unlink in os.supports_dir_fd:
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        except OSError:
+            pass
+    
+    deleted = 0
+    
+    try:
+        for name in names:
+            try:
+                if dir_fd is not None:
+                    os.unlink(name, dir_fd=dir_fd)
+                else:
+                    os.unlink(os.path.join(directory, name))
+                deleted += 1
+                logger.debug("Deleted old file: %s/%s", directory, name)
+            except Exception as e:
+                logger.error("Failed to delete %s: %s", os.path.join(directory, name), e)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
     
     return deleted
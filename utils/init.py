@@ -23,6 +23,7 @@ from .helpers import (
     parse_phone_number,
     validate_telegram_id,
     retry_async,
+    run_blocking,
     RateLimiter,
     TimeTracker,
     MemoryMonitor
@@ -56,6 +57,7 @@ __all__ = [
     "parse_phone_number",
     "validate_telegram_id",
     "retry_async",
+    "run_blocking",
     "RateLimiter",
     "TimeTracker",
     "MemoryMonitor",
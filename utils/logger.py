@@ -5,18 +5,32 @@ Advanced logging system with colors, rotation, and statistics.
 Production-ready logging for Telegram Mirror Bot.
 """
 
+import os
 import sys
+import time
+import queue
+import atexit
 import logging
-import asyncio
+import threading
+from array import array
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any, Union
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
-from collections import defaultdict
+from logging.handlers import (
+    RotatingFileHandler, TimedRotatingFileHandler, QueueHandler, QueueListener,
+    MemoryHandler
+)
+from collections import deque
+from itertools import islice
 import json
 
 from colorama import init, Fore, Back, Style
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Initialize colorama for cross-platform colors
 init(autoreset=True)
 
@@ -69,6 +83,12 @@ class ColoredFormatter(logging.Formatter):
         self.use_colors = use_colors
         self.use_emojis = use_emojis
         
+        # Pre-colored, pre-padded level names
+        self._colored_levels = {
+            level: f"{color}{level:<8}{Style.RESET_ALL}"
+            for level, color in self.COLORS.items()
+        }
+        
         # Build format string
         fmt_parts = []
         
@@ -80,16 +100,31 @@ class ColoredFormatter(logging.Formatter):
         
         fmt_parts.extend([
             '%(levelname)-8s',
-            '%(name)s',
+            '%(shortname)s',
             '%(message)s'
         ])
         
         fmt = ' | '.join(fmt_parts)
         super().__init__(fmt, datefmt='%H:%M:%S')
+        self._uses_time = self._style.usesTime()
+        
+        # Emojis keyed by level number, unaffected by the colored name
+        self._emojis = {
+            getattr(logging, level): emoji
+            for level, emoji in self.EMOJIS.items()
+        }
+        
+        # Pick the per-record path once instead of branching per record
+        self._format_base = self._format_emoji if use_emojis else self._format_plain
+        self.format = self._format_colored if use_colors else self._format_base
     
-    def format(self, record: logging.LogRecord) -> str:
+    def usesTime(self) -> bool:
+        """Return cached result of the format string check."""
+        return self._uses_time
+    
+    def _format_emoji(self, record: logging.LogRecord) -> str:
         """
-        Format log record with colors and emojis.
+        Format log record with emoji indicator.
         
         Args:
             record: Log record to format
@@ -97,24 +132,39 @@ class ColoredFormatter(logging.Formatter):
         Returns:
             str: Formatted log message
         """
-        # Add emoji to record
-        if self.use_emojis:
-            record.emoji = self.EMOJIS.get(record.levelname, '')
-        
-        # Format base message
-        message = super().format(record)
+        record.emoji = self._emojis.get(record.levelno, '')
+        return self._format_plain(record)
+    
+    def _format_plain(self, record: logging.LogRecord) -> str:
+        """
+        Format log record with short logger name.
         
-        # Add colors
-        if self.use_colors and record.levelname in self.COLORS:
-            color = self.COLORS[record.levelname]
+        Args:
+            record: Log record to format
             
-            # Color the level name
-            message = message.replace(
-                record.levelname,
-                f"{color}{record.levelname}{Style.RESET_ALL}"
-            )
+        Returns:
+            str: Formatted log message
+        """
+        record.shortname = _short_name(record.name)
+        return logging.Formatter.format(self, record)
+    
+    def _format_colored(self, record: logging.LogRecord) -> str:
+        """
+        Format log record with colored level name.
         
-        return message
+        Args:
+            record: Log record to format
+            
+        Returns:
+            str: Formatted log message
+        """
+        # Swap in the colored level name for this format only
+        levelname = record.levelname
+        record.levelname = self._colored_levels.get(levelname, levelname)
+        try:
+            return self._format_base(record)
+        finally:
+            record.levelname = levelname
 
 
 # ==================== JSON FORMATTER ====================
@@ -130,6 +180,20 @@ class JSONFormatter(logging.Formatter):
         - Easy parsing
     """
     
+    # Standard LogRecord attributes; anything else is an extra field
+    _RESERVED = frozenset({
+        'name', 'msg', 'args', 'created', 'filename',
+        'funcName', 'levelname', 'levelno', 'lineno',
+        'module', 'msecs', 'message', 'pathname', 'process',
+        'processName', 'relativeCreated', 'thread',
+        'threadName', 'exc_info', 'exc_text', 'stack_info',
+        'taskName', 'asctime', 'emoji', 'shortname'
+    })
+    
+    # Second-resolution timestamp prefix, reused within the same second
+    _last_sec = -1
+    _last_str = ''
+    
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record as JSON.
@@ -140,8 +204,13 @@ class JSONFormatter(logging.Formatter):
         Returns:
             str: JSON formatted log
         """
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_str = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec))
+        
         log_obj = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': f"{self._last_str}.{int(record.msecs):03d}Z",
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -155,15 +224,12 @@ class JSONFormatter(logging.Formatter):
             log_obj['exception'] = self.formatException(record.exc_info)
         
         # Add extra fields
-        for key, value in record.__dict__.items():
-            if key not in [
-                'name', 'msg', 'args', 'created', 'filename',
-                'funcName', 'levelname', 'levelno', 'lineno',
-                'module', 'msecs', 'message', 'pathname', 'process',
-                'processName', 'relativeCreated', 'thread',
-                'threadName', 'exc_info', 'exc_text', 'stack_info'
-            ]:
-                log_obj[key] = value
+        attrs = record.__dict__
+        for key in attrs.keys() - self._RESERVED:
+            log_obj[key] = attrs[key]
+        
+        if orjson:
+            return orjson.dumps(log_obj).decode()
         
         return json.dumps(log_obj, ensure_ascii=False)
 
@@ -181,68 +247,94 @@ class LogStats:
         - Memory usage
     """
     
+    # One counter slot per standard level, indexed by levelno // 10 - 1
+    LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+    MAX_ERRORS = 100
+    
     def __init__(self):
         """Initialize log statistics."""
-        self.counts = defaultdict(int)
-        self.errors = []
-        self.start_time = datetime.utcnow()
-        self._lock = asyncio.Lock()
+        self.counts = array('Q', [0] * len(self.LEVELS))
+        self.errors: deque = deque(maxlen=self.MAX_ERRORS)
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
     
-    async def record(self, level: str, message: str) -> None:
+    def record(self, record: logging.LogRecord) -> None:
         """
         Record log event.
         
+        Called synchronously from the logging thread, so it never
+        touches the event loop.
+        
         Args:
-            level: Log level
-            message: Log message
+            record: Log record
         """
-        async with self._lock:
-            self.counts[level] += 1
+        # Clamp custom levels into the nearest standard slot
+        idx = min(max(record.levelno // 10, 1), len(self.LEVELS)) - 1
+        
+        with self._lock:
+            self.counts[idx] += 1
             
-            if level in ('ERROR', 'CRITICAL'):
-                self.errors.append({
-                    'time': datetime.utcnow(),
-                    'level': level,
-                    'message': message[:200]  # Truncate long messages
-                })
-                
-                # Keep only last 100 errors
-                if len(self.errors) > 100:
-                    self.errors.pop(0)
-    
-    async def get_stats(self) -> Dict[str, Any]:
+            # Only errors pay for message formatting
+            if record.levelno >= logging.ERROR:
+                self.errors.append((
+                    record.created,
+                    record.levelname,
+                    record.getMessage()[:200]  # Truncate long messages
+                ))
+    
+    def get_stats(self) -> Dict[str, Any]:
         """
         Get current statistics.
         
         Returns:
             Dict with statistics
         """
-        async with self._lock:
-            uptime = datetime.utcnow() - self.start_time
-            
-            return {
-                'uptime_seconds': uptime.total_seconds(),
-                'total_logs': sum(self.counts.values()),
-                'counts_by_level': dict(self.counts),
-                'error_count': len(self.errors),
-                'recent_errors': self.errors[-10:],  # Last 10 errors
-                'logs_per_minute': self._calculate_rate()
+        # Snapshot under the lock, build the result outside it
+        with self._lock:
+            counts = self.counts[:]
+            error_count = len(self.errors)
+            recent = list(islice(reversed(self.errors), 10))  # Last 10 errors
+            started = self._started
+        
+        # Format timestamps only for the errors actually returned
+        recent = [
+            {
+                'time': datetime.fromtimestamp(created, timezone.utc).isoformat(),
+                'level': level,
+                'message': message
             }
+            for created, level, message in reversed(recent)
+        ]
+        uptime = time.monotonic() - started
+        total = sum(counts)
+        
+        return {
+            'uptime_seconds': uptime,
+            'total_logs': total,
+            'counts_by_level': {
+                level: count
+                for level, count in zip(self.LEVELS, counts)
+                if count
+            },
+            'error_count': error_count,
+            'recent_errors': recent,
+            'logs_per_minute': self._calculate_rate(total, uptime)
+        }
     
-    def _calculate_rate(self) -> float:
+    @staticmethod
+    def _calculate_rate(total: int, uptime: float) -> float:
         """Calculate logging rate."""
-        uptime = (datetime.utcnow() - self.start_time).total_seconds()
-        
         if uptime > 0:
-            return (sum(self.counts.values()) / uptime) * 60
+            return (total / uptime) * 60
         
         return 0.0
     
     def reset(self) -> None:
         """Reset statistics."""
-        self.counts.clear()
-        self.errors.clear()
-        self.start_time = datetime.utcnow()
+        with self._lock:
+            self.counts = array('Q', [0] * len(self.LEVELS))
+            self.errors.clear()
+            self._started = time.monotonic()
 
 
 # Global stats instance
@@ -263,10 +355,213 @@ class StatsHandler(logging.Handler):
         Args:
             record: Log record
         """
-        # Run async task in background
-        asyncio.create_task(
-            _log_stats.record(record.levelname, record.getMessage())
+        _log_stats.record(record)
+
+
+# ==================== NAME FILTER ====================
+
+# Dotted logger name -> last component, computed once per logger
+_short_names: Dict[str, str] = {}
+
+
+def _short_name(name: str) -> str:
+    """Return last component of a dotted logger name (cached)."""
+    short = _short_names.get(name)
+    
+    if short is None:
+        short = _short_names[name] = name.rsplit('.', 1)[-1]
+    
+    return short
+
+
+class ShortNameFilter(logging.Filter):
+    """
+    Adds ``shortname`` (last component of the logger name) to records.
+    
+    Keeps the real dotted logger names intact, so the hierarchy,
+    level inheritance and propagation keep working.
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Attach short name to record.
+        
+        Args:
+            record: Log record
+            
+        Returns:
+            bool: Always True
+        """
+        record.shortname = _short_name(record.name)
+        return True
+
+
+# ==================== FILE HANDLERS ====================
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that writes through a large stream buffer.
+    
+    Records are not flushed one by one, and the file size is tracked
+    in-process instead of seeking before every write. Flushing is left
+    to FileBatchHandler.
+    """
+    
+    BUFFER_SIZE = 64 * 1024
+    
+    # Never fail a record on bad surrogates. Passed to open() directly:
+    # the handler's own errors= argument needs Python 3.9+.
+    ENCODING_ERRORS = 'replace'
+    
+    def _open(self):
+        """Open log file with a 64 KiB write buffer."""
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.ENCODING_ERRORS
+        )
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Write record into the stream buffer, rolling over when full.
+        
+        Args:
+            record: Log record
+        """
+        try:
+            msg = self.format(record) + self.terminator
+            
+            if self.stream is None:
+                self.stream = self._open()
+            
+            # maxBytes counts encoded bytes; chat text is often non-ASCII
+            size = len(msg) if msg.isascii() else len(
+                msg.encode(self.encoding or 'utf-8', self.ENCODING_ERRORS)
+            )
+            
+            if self.maxBytes > 0 and self._size + size >= self.maxBytes:
+                self.doRollover()
+                
+                # Rollover leaves the stream closed when delay is set
+                if self.stream is None:
+                    self.stream = self._open()
+            
+            self.stream.write(msg)
+            self._size += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class FileBatchHandler(MemoryHandler):
+    """
+    Batches records in front of a file handler.
+    
+    Buffered records reach the file when the buffer fills, on ERROR
+    and above, on close, and every FLUSH_INTERVAL seconds.
+    """
+    
+    FLUSH_INTERVAL = 30.0
+    
+    def __init__(self, target: logging.Handler, capacity: int = 1024):
+        """
+        Initialize batch handler.
+        
+        Args:
+            target: Handler that writes the records
+            capacity: Records buffered before flushing
+        """
+        super().__init__(
+            capacity,
+            flushLevel=logging.ERROR,
+            target=target,
+            flushOnClose=True
         )
+        self._closed = False
+        self._timer: Optional[threading.Timer] = None
+        self._schedule_flush()
+    
+    def _schedule_flush(self) -> None:
+        """Arm the periodic flush timer."""
+        if self._closed:
+            return
+        
+        self._timer = threading.Timer(self.FLUSH_INTERVAL, self._periodic_flush)
+        self._timer.daemon = True
+        self._timer.start()
+    
+    def _periodic_flush(self) -> None:
+        """Flush buffered records, then re-arm the timer."""
+        self.flush()
+        self._schedule_flush()
+    
+    def flush(self) -> None:
+        """Send buffered records to the target and flush its stream."""
+        self.acquire()
+        try:
+            target = self.target
+            super().flush()
+            
+            if target:
+                target.flush()
+        finally:
+            self.release()
+    
+    def close(self) -> None:
+        """Stop the timer and flush remaining records."""
+        self._closed = True
+        
+        if self._timer:
+            self._timer.cancel()
+        
+        super().close()
+
+
+# ==================== QUEUE HANDLER ====================
+
+class LogQueueHandler(QueueHandler):
+    """
+    Queue handler that keeps exception info for the listener.
+    
+    The stock prepare() folds the traceback into the message, which
+    would hide it from JSONFormatter. The queue never leaves this
+    process, so only the message arguments are resolved here.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Resolve message arguments on the calling thread.
+        
+        Args:
+            record: Log record
+            
+        Returns:
+            The same record, ready to enqueue
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Listener thread that owns the real handlers
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Drain queued records and stop the listener thread."""
+    global _listener
+    
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 # ==================== SETUP FUNCTIONS ====================
@@ -282,6 +577,9 @@ def setup_logging(
     """
     Setup logging configuration.
     
+    Records are enqueued on the calling thread and written by a single
+    QueueListener thread, so log calls never block on console or disk.
+    
     Args:
         level: Logging level
         log_file: Log file path (optional)
@@ -295,7 +593,9 @@ def setup_logging(
     root_logger.setLevel(level)
     
     # Remove existing handlers
+    _stop_listener()
     root_logger.handlers.clear()
+    handlers = []
     
     # Console handler with colors
     console_handler = logging.StreamHandler(sys.stdout)
@@ -305,12 +605,12 @@ def setup_logging(
         console_formatter = ColoredFormatter()
     else:
         console_formatter = logging.Formatter(
-            '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
+            '%(asctime)s | %(levelname)-8s | %(shortname)s | %(message)s',
             datefmt='%H:%M:%S'
         )
     
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler if specified
     if log_file:
@@ -319,11 +619,12 @@ def setup_logging(
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Create rotating file handler
-        file_handler = RotatingFileHandler(
+        file_handler = BufferedRotatingFileHandler(
             log_file,
             maxBytes=max_bytes,
             backupCount=backup_count,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True  # Open on first record
         )
         file_handler.setLevel(level)
         
@@ -332,17 +633,30 @@ def setup_logging(
             file_formatter = JSONFormatter()
         else:
             file_formatter = logging.Formatter(
-                '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
+                '%(asctime)s | %(levelname)-8s | %(shortname)s | %(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
         
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        
+        # Coalesce disk writes; errors still flush immediately
+        batch_handler = FileBatchHandler(file_handler)
+        batch_handler.setLevel(level)
+        handlers.append(batch_handler)
     
     # Add stats handler
     stats_handler = StatsHandler()
     stats_handler.setLevel(logging.DEBUG)
-    root_logger.addHandler(stats_handler)
+    handlers.append(stats_handler)
+    
+    # Hand records to the listener thread
+    global _listener
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    queue_handler = LogQueueHandler(log_queue)
+    queue_handler.addFilter(ShortNameFilter())
+    root_logger.addHandler(queue_handler)
     
     # Log setup complete
     logger = logging.getLogger(__name__)
@@ -356,20 +670,16 @@ def get_logger(name: str) -> logging.Logger:
     """
     Get logger instance for module.
     
+    The display name is shortened by ShortNameFilter at format time;
+    the logger itself keeps its full dotted name.
+    
     Args:
         name: Logger name (usually __name__)
         
     Returns:
         Logger instance
     """
-    logger = logging.getLogger(name)
-    
-    # Shorten name for display
-    if '.' in name:
-        # Use last component only
-        logger.name = name.split('.')[-1]
-    
-    return logger
+    return logging.getLogger(name)
 
 
 def get_log_stats() -> LogStats:
@@ -390,6 +700,7 @@ async def cleanup_old_logs(
 ) -> int:
     """
     Clean up old log files.
+    File system calls run in a worker thread, off the event loop.
     
     Args:
         log_dir: Log directory
@@ -398,22 +709,36 @@ async def cleanup_old_logs(
     Returns:
         int: Number of files deleted
     """
-    log_dir = Path(log_dir)
+    from .helpers import run_blocking  # helpers imports this module
+    
+    return await run_blocking(_cleanup_old_logs_sync, log_dir, days_to_keep)
+
+
+def _cleanup_old_logs_sync(log_dir: Union[str, Path], days_to_keep: int) -> int:
+    """Blocking body of cleanup_old_logs()."""
+    from .helpers import unlink_batch  # helpers imports this module
     
-    if not log_dir.exists():
+    if not os.path.isdir(log_dir):
         return 0
     
-    deleted = 0
+    expired = []
     cutoff = datetime.now().timestamp() - (days_to_keep * 86400)
     
-    for log_file in log_dir.glob("*.log*"):
-        if log_file.stat().st_mtime < cutoff:
+    # Single directory pass; same names as the old "*.log*" glob
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith('.') or '.log' not in entry.name:
+                continue
+            
             try:
-                log_file.unlink()
-                deleted += 1
-            except Exception as e:
+                if (entry.is_file(follow_symlinks=False)
+                        and entry.stat(follow_symlinks=False).st_mtime < cutoff):
+                    expired.append(entry.name)
+            except OSError as e:
                 logger = get_logger(__name__)
-                logger.error(f"Failed to delete {log_file}: {e}")
+                logger.error(f"Failed to stat {entry.path}: {e}")
+    
+    deleted = unlink_batch(log_dir, expired)
     
     if deleted > 0:
         logger = get_logger(__name__)
@@ -6,14 +6,19 @@ Optimized for Telegram media handling.
 """
 
 import os
+import io
+import time
+import mmap
+import shutil
+import logging
 import asyncio
 import hashlib
 import mimetypes
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 from datetime import datetime
 
-import aiofiles
 from PIL import Image, ImageOps
 
 # Make ffmpeg optional for Termux
@@ -22,14 +27,69 @@ try:
 except ImportError:
     ffmpeg = None
 
-from .helpers import format_file_size, sanitize_filename, ensure_directory
+# Faster media fingerprints when available
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+from .helpers import (
+    format_file_size, sanitize_filename, ensure_directory, unlink_batch,
+    run_blocking
+)
 from .logger import get_logger
+from ._cpu import HAS_SHANI, HAS_WIDE_SIMD
 
 logger = get_logger(__name__)
 
+# Files above this size are hashed through a memory map, in windows
+# of _MMAP_WINDOW so huge files never map more than that at once
+_MMAP_HASH_THRESHOLD = 1024 * 1024
+_MMAP_WINDOW = 1024 * 1024 * 1024
+
+
+def _pick_hash() -> str:
+    """
+    Choose the fastest available fingerprint for this CPU.
+    
+    Hash is only used for media identity, not security. BLAKE3 leads
+    with AVX2/NEON but its portable code trails xxh3; SHA-256 beats
+    MD5 and BLAKE2b only with SHA extensions (OpenSSL dispatches).
+    """
+    if blake3 and (HAS_WIDE_SIMD or not xxhash):
+        return "blake3"
+    if xxhash:
+        return "xxh3"
+    return "sha256" if HAS_SHANI else "blake2b"
+
+
+_DEFAULT_HASH = _pick_hash()
+
+# Files above max_hash_bytes get a head+tail sampled fingerprint
+_HASH_MAX_BYTES = 50 * 1024 * 1024
+_HASH_SAMPLE_SIZE = 64 * 1024
+
+# Upright JPEGs within bounds and below this size skip re-encoding
+_PHOTO_PASSTHROUGH_BYTES = 512 * 1024
+
+# EXIF orientation tag; values 5-8 swap width and height
+_EXIF_ORIENTATION = 0x0112
+_EXIF_ROTATED = frozenset((5, 6, 7, 8))
+
 
 # ==================== PATH MANAGEMENT ====================
 
+@lru_cache(maxsize=1)
+def _temp_dir() -> str:
+    """Create the temp directory once, not on every path request."""
+    return str(ensure_directory(Path("temp")))
+
+
 def get_temp_path(
     identifier: Union[str, int],
     extension: str = None
@@ -44,16 +104,15 @@ def get_temp_path(
     Returns:
         str: Temporary file path
     """
-    temp_dir = ensure_directory(Path("temp"))
+    temp_dir = _temp_dir()
     
-    # Generate unique filename
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    filename = f"{timestamp}_{identifier}"
+    # Generate unique filename (nanosecond stamp, sortable)
+    filename = f"{time.time_ns()}_{identifier}"
     
     if extension:
         filename = f"{filename}.{extension.lstrip('.')}"
     
-    return str(temp_dir / filename)
+    return os.path.join(temp_dir, filename)
 
 
 async def cleanup_temp(
@@ -62,6 +121,7 @@ async def cleanup_temp(
 ) -> int:
     """
     Clean up temporary files.
+    File system calls run in a worker thread, off the event loop.
     
     Args:
         path: Specific file to delete or None for all old files
@@ -70,34 +130,45 @@ async def cleanup_temp(
     Returns:
         int: Number of files deleted
     """
+    return await run_blocking(_cleanup_temp_sync, path, older_than_hours)
+
+
+def _cleanup_temp_sync(
+    path: Optional[Union[str, Path]],
+    older_than_hours: int
+) -> int:
+    """Blocking body of cleanup_temp()."""
     if path:
         # Delete specific file
         try:
             path = Path(path)
             if path.exists():
                 path.unlink()
-                logger.debug(f"Deleted temp file: {path}")
+                logger.debug("Deleted temp file: %s", path)
                 return 1
         except Exception as e:
             logger.error(f"Failed to delete {path}: {e}")
         return 0
     
     # Clean old files
-    temp_dir = Path("temp")
-    if not temp_dir.exists():
+    temp_dir = "temp"
+    if not os.path.isdir(temp_dir):
         return 0
     
-    deleted = 0
+    expired = []
     cutoff = datetime.now().timestamp() - (older_than_hours * 3600)
     
-    for file in temp_dir.iterdir():
-        if file.is_file():
-            if file.stat().st_mtime < cutoff:
-                try:
-                    file.unlink()
-                    deleted += 1
-                except Exception as e:
-                    logger.error(f"Failed to delete {file}: {e}")
+    # Single directory pass; file type comes from readdir
+    with os.scandir(temp_dir) as entries:
+        for entry in entries:
+            try:
+                if (entry.is_file(follow_symlinks=False)
+                        and entry.stat(follow_symlinks=False).st_mtime < cutoff):
+                    expired.append(entry.name)
+            except OSError as e:
+                logger.error(f"Failed to stat {entry.path}: {e}")
+    
+    deleted = unlink_batch(temp_dir, expired)
     
     if deleted > 0:
         logger.info(f"Cleaned up {deleted} old temp files")
@@ -107,30 +178,52 @@ async def cleanup_temp(
 
 # ==================== MEDIA INFO ====================
 
-async def get_media_info(file_path: Union[str, Path]) -> Dict[str, Any]:
+@lru_cache(maxsize=256)
+def _guess_mime(suffix: str) -> Optional[str]:
+    """Guess MIME type from a lowercase file suffix (cached)."""
+    return mimetypes.guess_type(f"x{suffix}")[0]
+
+
+async def get_media_info(
+    file_path: Union[str, Path],
+    include_hash: bool = True,
+    max_hash_bytes: int = _HASH_MAX_BYTES
+) -> Dict[str, Any]:
     """
     Get detailed media file information.
     
     Args:
         file_path: Path to media file
+        include_hash: Compute a content fingerprint
+        max_hash_bytes: Files larger than this get a sampled fingerprint
+            (size + first and last 64 KiB) instead of a full read
         
     Returns:
-        Dict with media information
+        Dict with media information. A full-file digest is stored under
+        "hash"; a sampled fingerprint under "hash_sampled" instead, as
+        it only identifies files by size, head and tail.
     """
     file_path = Path(file_path)
     
-    if not file_path.exists():
+    # One stat() serves the existence check, size and mtime
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
         return {"error": "File not found"}
     
     info = {
         "filename": file_path.name,
-        "size_bytes": file_path.stat().st_size,
-        "size_formatted": format_file_size(file_path.stat().st_size),
-        "mime_type": mimetypes.guess_type(str(file_path))[0],
-        "modified": datetime.fromtimestamp(file_path.stat().st_mtime),
-        "hash": await _calculate_file_hash(file_path)
+        "size_bytes": st.st_size,
+        "size_formatted": format_file_size(st.st_size),
+        "mime_type": _guess_mime(file_path.suffix.lower()),
+        "modified": datetime.fromtimestamp(st.st_mtime),
+        "hash": None
     }
     
+    if include_hash:
+        digest = await _calculate_file_hash(file_path, max_bytes=max_hash_bytes)
+        info[_hash_key(st.st_size, max_hash_bytes)] = digest
+    
     # Get media-specific info
     mime = info["mime_type"] or ""
     
@@ -144,31 +237,118 @@ async def get_media_info(file_path: Union[str, Path]) -> Dict[str, Any]:
     return info
 
 
+def _is_sampled(size: int, max_bytes: Optional[int]) -> bool:
+    """Whether a file of this size gets a sampled fingerprint."""
+    return max_bytes is not None and size > max(max_bytes, 2 * _HASH_SAMPLE_SIZE)
+
+
+def _hash_key(size: int, max_bytes: Optional[int]) -> str:
+    """Info key for a file's fingerprint: "hash" or "hash_sampled"."""
+    return "hash_sampled" if _is_sampled(size, max_bytes) else "hash"
+
+
 async def _calculate_file_hash(
     file_path: Path,
-    algorithm: str = "md5"
+    algorithm: str = _DEFAULT_HASH,
+    max_bytes: Optional[int] = None
 ) -> str:
     """
     Calculate file hash.
+    Hashing runs in a worker thread, off the event loop.
     
     Args:
         file_path: Path to file
-        algorithm: Hash algorithm (md5, sha1, sha256)
+        algorithm: Hash algorithm (blake3, xxh3, blake2b, sha256, md5, ...)
+        max_bytes: Sample head and tail of files larger than this
         
     Returns:
         str: File hash
     """
-    hasher = hashlib.new(algorithm)
+    return await run_blocking(_hash_file_sync, file_path, algorithm, max_bytes)
+
+
+def _new_hasher(algorithm: str):
+    """Create hash object, using all cores for BLAKE3."""
+    if algorithm == "blake3":
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    
+    # Non-cryptographic, memory-bandwidth speed
+    if algorithm == "xxh3":
+        return xxhash.xxh3_128()
     
-    async with aiofiles.open(file_path, 'rb') as f:
-        while chunk := await f.read(8192):
-            hasher.update(chunk)
+    # Fingerprint-only fast path, quicker than MD5 in software
+    if algorithm == "blake2b":
+        return hashlib.blake2b(digest_size=16)
+    
+    return hashlib.new(algorithm)
+
+
+def _hash_file_sync(
+    file_path: Path,
+    algorithm: str,
+    max_bytes: Optional[int] = None
+) -> str:
+    """Blocking body of _calculate_file_hash()."""
+    # Unbuffered: file_digest() and read() fill their own buffers directly
+    with open(file_path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        
+        # Huge files: size + head + tail, constant cost for any size
+        if _is_sampled(size, max_bytes):
+            hasher = _new_hasher(algorithm)
+            hasher.update(size.to_bytes(8, 'little'))
+            hasher.update(f.read(_HASH_SAMPLE_SIZE))
+            f.seek(-_HASH_SAMPLE_SIZE, os.SEEK_END)
+            hasher.update(f.read(_HASH_SAMPLE_SIZE))
+            return hasher.hexdigest()
+        
+        # Large files: feed each mapping to the hasher in one call
+        if size > _MMAP_HASH_THRESHOLD:
+            hasher = _new_hasher(algorithm)
+            for offset in range(0, size, _MMAP_WINDOW):
+                length = min(_MMAP_WINDOW, size - offset)
+                with mmap.mmap(
+                    f.fileno(), length, access=mmap.ACCESS_READ, offset=offset
+                ) as mm:
+                    # Read once front to back: ask for aggressive readahead
+                    if hasattr(mm, 'madvise'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hasher.update(mm)
+            return hasher.hexdigest()
+        
+        # Python 3.11+
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, lambda: _new_hasher(algorithm)).hexdigest()
+        
+        hasher = _new_hasher(algorithm)
+        hasher.update(f.read())
+        return hasher.hexdigest()
+
+
+def _hash_files_sync(
+    paths: List[Path],
+    algorithm: str = _DEFAULT_HASH
+) -> List[Optional[str]]:
+    """Hash several files in one blocking call (None if unreadable)."""
+    hashes = []
+    
+    for path in paths:
+        try:
+            hashes.append(_hash_file_sync(path, algorithm, _HASH_MAX_BYTES))
+        except OSError as e:
+            logger.error(f"Failed to hash {path}: {e}")
+            hashes.append(None)
     
-    return hasher.hexdigest()
+    return hashes
 
 
 async def _get_image_info(file_path: Path) -> Dict[str, Any]:
-    """Get image-specific information."""
+    """Get image-specific information (decoded in a worker thread)."""
+    return await run_blocking(_get_image_info_sync, file_path)
+
+
+def _get_image_info_sync(file_path: Path) -> Dict[str, Any]:
+    """Blocking body of _get_image_info()."""
     try:
         with Image.open(file_path) as img:
             return {
@@ -186,13 +366,37 @@ async def _get_image_info(file_path: Path) -> Dict[str, Any]:
         return {"type": "image", "error": str(e)}
 
 
+@lru_cache(maxsize=256)
+def _probe_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Run ffprobe once per file version.
+    
+    mtime_ns is part of the cache key so a rewritten file is probed
+    again. The returned dict is shared; callers must not modify it.
+    """
+    return ffmpeg.probe(path)
+
+
+async def _probe(file_path: Union[str, Path]) -> Dict[str, Any]:
+    """Probe media file with ffprobe in a worker thread (cached)."""
+    mtime_ns = os.stat(file_path).st_mtime_ns
+    return await run_blocking(_probe_cached, str(file_path), mtime_ns)
+
+
+def _parse_frame_rate(rate: str) -> float:
+    """Parse an ffprobe rate such as '30000/1001' (0.0 if undefined)."""
+    num, _, den = rate.partition('/')
+    den = int(den) if den else 1
+    return int(num) / den if den else 0.0
+
+
 async def _get_video_info(file_path: Path) -> Dict[str, Any]:
     """Get video-specific information."""
     if not ffmpeg:
         return {"type": "video", "note": "ffmpeg not available"}
     
     try:
-        probe = ffmpeg.probe(str(file_path))
+        probe = await _probe(file_path)
         
         video_info = {"type": "video"}
         
@@ -210,7 +414,7 @@ async def _get_video_info(file_path: Path) -> Dict[str, Any]:
                 "height": stream.get('height'),
                 "resolution": f"{stream.get('width')}x{stream.get('height')}",
                 "duration": float(probe['format'].get('duration', 0)),
-                "fps": eval(stream.get('r_frame_rate', '0/1')),
+                "fps": _parse_frame_rate(stream.get('r_frame_rate', '0/1')),
                 "bitrate": int(probe['format'].get('bit_rate', 0))
             })
         
@@ -227,7 +431,7 @@ async def _get_audio_info(file_path: Path) -> Dict[str, Any]:
         return {"type": "audio", "note": "ffmpeg not available"}
     
     try:
-        probe = ffmpeg.probe(str(file_path))
+        probe = await _probe(file_path)
         
         audio_info = {"type": "audio"}
         
@@ -274,42 +478,65 @@ async def optimize_photo(
     Returns:
         Optional[str]: Output path if successful
     """
+    # PIL decode/resize/encode is CPU-bound; keep it off the event loop
+    return await run_blocking(
+        _optimize_photo_sync, input_path, output_path, max_size, quality
+    )
+
+
+def _optimize_photo_sync(
+    input_path: Union[str, Path],
+    output_path: Optional[Union[str, Path]],
+    max_size: Tuple[int, int],
+    quality: int
+) -> Optional[str]:
+    """Blocking body of optimize_photo()."""
     try:
         input_path = Path(input_path)
         output_path = Path(output_path) if output_path else input_path
+        original_size = input_path.stat().st_size
         
         with Image.open(input_path) as img:
+            orientation = img.getexif().get(_EXIF_ORIENTATION, 1)
+            
+            # Already small, upright and in bounds: header is enough to
+            # tell, so skip the decode/encode round-trip entirely
+            if (
+                img.format == 'JPEG'
+                and original_size <= _PHOTO_PASSTHROUGH_BYTES
+                and img.width <= max_size[0] and img.height <= max_size[1]
+                and orientation == 1
+            ):
+                if output_path != input_path:
+                    shutil.copyfile(input_path, output_path)  # sendfile on Linux
+                return str(output_path)
+            
+            # Bound the stored (unrotated) frame so the upright result
+            # fits max_size after the transpose below
+            bounds = max_size[::-1] if orientation in _EXIF_ROTATED else max_size
+            
+            # Resize first so later steps touch fewer pixels. thumbnail()
+            # drafts JPEGs at reduced DCT scale and box-reduces before
+            # the LANCZOS pass.
+            if img.width > bounds[0] or img.height > bounds[1]:
+                img.thumbnail(bounds, Image.Resampling.LANCZOS, reducing_gap=2.0)
+            
+            # Auto-orient on the reduced image, while EXIF is still attached
+            if orientation != 1:
+                img = ImageOps.exif_transpose(img)
+            
             # Convert RGBA to RGB if needed
             if img.mode == 'RGBA':
                 rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                rgb_img.paste(img, mask=img.split()[3])
+                rgb_img.paste(img, mask=img.getchannel('A'))
                 img = rgb_img
             
-            # Resize if needed
-            if img.width > max_size[0] or img.height > max_size[1]:
-                img.thumbnail(max_size, Image.Resampling.LANCZOS)
-            
-            # Auto-orient based on EXIF
-            img = ImageOps.exif_transpose(img)
-            
             # Save optimized
-            img.save(
-                output_path,
-                format='JPEG',
-                quality=quality,
-                optimize=True
-            )
-        
-        # Log size reduction
-        original_size = input_path.stat().st_size
-        new_size = output_path.stat().st_size
+            _save_jpeg(img, output_path, quality=quality, optimize=True)
         
-        if new_size < original_size:
-            reduction = (1 - new_size / original_size) * 100
-            logger.info(
-                f"Image optimized: {format_file_size(original_size)} → "
-                f"{format_file_size(new_size)} ({reduction:.1f}% reduction)"
-            )
+        # Log size reduction (stat only when it will be shown)
+        if logger.isEnabledFor(logging.INFO):
+            _log_reduction("Image optimized", original_size, output_path)
         
         return str(output_path)
         
@@ -318,8 +545,80 @@ async def optimize_photo(
         return None
 
 
+def _log_reduction(label: str, original_size: int, output_path: Path) -> None:
+    """Log how much smaller output_path is than the original."""
+    new_size = output_path.stat().st_size
+    
+    if new_size < original_size:
+        logger.info(
+            "%s: %s → %s (%.1f%% reduction)",
+            label,
+            format_file_size(original_size),
+            format_file_size(new_size),
+            (1 - new_size / original_size) * 100
+        )
+
+
+def _save_jpeg(img: Image.Image, output_path: Path, **params) -> None:
+    """
+    Encode image as JPEG in memory, then write it in one go.
+    
+    The encoder's many small writes land in a BytesIO instead of the
+    file; the result is written to a sibling temp file and renamed
+    over the target, so a crash never leaves a truncated JPEG behind
+    (including when optimizing in place).
+    
+    Args:
+        img: Image to encode
+        output_path: Destination path
+        **params: Extra PIL save options (quality, optimize, ...)
+    """
+    buf = io.BytesIO()
+    img.save(buf, format='JPEG', **params)
+    
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb', buffering=0) as f:
+            f.write(buf.getbuffer())
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 # ==================== VIDEO COMPRESSION ====================
 
+# Each encode already uses every core (threads=0); a few at a time
+# avoids oversubscribing the CPU when a batch arrives
+_FFMPEG_CONCURRENCY = max(1, (os.cpu_count() or 1) // 2)
+_ffmpeg_slots: Optional[asyncio.Semaphore] = None
+
+
+async def _run_ffmpeg(argv: List[str]) -> int:
+    """
+    Run an ffmpeg command through the shared process slots.
+    
+    Args:
+        argv: Full command line
+        
+    Returns:
+        int: ffmpeg exit code
+    """
+    global _ffmpeg_slots
+    
+    # Created lazily so it binds to the running loop
+    if _ffmpeg_slots is None:
+        _ffmpeg_slots = asyncio.Semaphore(_FFMPEG_CONCURRENCY)
+    
+    async with _ffmpeg_slots:
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        return await proc.wait()
+
+
 async def compress_video(
     input_path: Union[str, Path],
     output_path: Optional[Union[str, Path]] = None,
@@ -350,7 +649,7 @@ async def compress_video(
                      input_path.with_suffix('.compressed.mp4')
         
         # Get input info
-        probe = ffmpeg.probe(str(input_path))
+        probe = await _probe(input_path)
         video_info = next(
             s for s in probe['streams'] 
             if s['codec_type'] == 'video'
@@ -369,41 +668,35 @@ async def compress_video(
             new_width = width
             new_height = height
         
-        # Build ffmpeg command
-        stream = ffmpeg.input(str(input_path))
+        # Build ffmpeg command (plain argv, no filter-graph builder)
+        argv = ['ffmpeg', '-y', '-i', str(input_path)]
         
         # Apply filters
         if new_width != width:
-            stream = ffmpeg.filter(stream, 'scale', new_width, new_height)
+            argv += ['-vf', f'scale={new_width}:{new_height}']
         
         # Output settings
-        stream = ffmpeg.output(
-            stream,
-            str(output_path),
-            vcodec='libx264',
-            crf=crf,
-            preset='medium',
-            acodec='aac',
-            audio_bitrate='128k'
-        )
+        argv += [
+            '-c:v', 'libx264',
+            '-crf', str(crf),
+            '-preset', 'medium',
+            '-threads', '0',  # All cores
+            '-c:a', 'aac',
+            '-b:a', '128k',
+            '-movflags', '+faststart',  # Streamable mp4
+            str(output_path)
+        ]
         
-        # Run compression
-        await asyncio.create_subprocess_exec(
-            *ffmpeg.compile(stream, overwrite_output=True),
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL
-        )
+        # Run compression and wait for ffmpeg to finish
+        returncode = await _run_ffmpeg(argv)
         
-        # Log compression
-        original_size = input_path.stat().st_size
-        new_size = output_path.stat().st_size
+        if returncode != 0:
+            logger.error(f"ffmpeg exited with code {returncode} compressing {input_path}")
+            return None
         
-        if new_size < original_size:
-            reduction = (1 - new_size / original_size) * 100
-            logger.info(
-                f"Video compressed: {format_file_size(original_size)} → "
-                f"{format_file_size(new_size)} ({reduction:.1f}% reduction)"
-            )
+        # Log compression
+        if logger.isEnabledFor(logging.INFO):
+            _log_reduction("Video compressed", input_path.stat().st_size, output_path)
         
         return str(output_path)
         
@@ -444,7 +737,8 @@ class MediaProcessor:
     async def process_media(
         self,
         file_path: Union[str, Path],
-        optimize: bool = True
+        optimize: bool = True,
+        include_hash: bool = True
     ) -> Optional[Dict[str, Any]]:
         """
         Process media file with auto-detection.
@@ -452,6 +746,7 @@ class MediaProcessor:
         Args:
             file_path: Media file path
             optimize: Whether to optimize/compress
+            include_hash: Fingerprint the file in get_media_info()
             
         Returns:
             Optional[Dict]: Processing results
@@ -463,7 +758,7 @@ class MediaProcessor:
             return None
         
         # Get media info
-        info = await get_media_info(file_path)
+        info = await get_media_info(file_path, include_hash=include_hash)
         
         if "error" in info:
             return info
@@ -495,6 +790,58 @@ class MediaProcessor:
         
         return result
     
+    async def batch_process(
+        self,
+        file_paths: List[Union[str, Path]],
+        optimize: bool = True,
+        parallel: Optional[int] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Process several media files (e.g. an album).
+        
+        All files are hashed up front in a single worker-thread call
+        instead of one thread hop per file. A fixed pool of workers
+        then processes the files, so only `parallel` coroutines are
+        alive however long the batch is.
+        
+        Args:
+            file_paths: Media file paths
+            optimize: Whether to optimize/compress
+            parallel: Files processed at once (default: CPU count - 1)
+            
+        Returns:
+            List of processing results, in input order
+        """
+        paths = [Path(p) for p in file_paths]
+        hashes = await run_blocking(_hash_files_sync, paths)
+        
+        if parallel is None:
+            parallel = max(2, (os.cpu_count() or 1) - 1)
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(paths)
+        pending = iter(enumerate(paths))
+        
+        async def worker() -> None:
+            # Workers share one iterator; next() never awaits, so no lock
+            for index, path in pending:
+                results[index] = await self.process_media(
+                    path, optimize, include_hash=False
+                )
+        
+        await asyncio.gather(*(
+            worker() for _ in range(min(parallel, len(paths)))
+        ))
+        
+        for result, file_hash in zip(results, hashes):
+            if result and "info" in result:
+                info = result["info"]
+                info[_hash_key(info["size_bytes"], _HASH_MAX_BYTES)] = file_hash
+                self._stats["processed"] += 1
+            else:
+                self._stats["failed"] += 1
+        
+        return results
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get processing statistics."""
         return self._stats.copy()
@@ -546,7 +893,7 @@ class ThumbnailGenerator:
         input_path = Path(input_path)
         
         # Determine media type
-        mime_type = mimetypes.guess_type(str(input_path))[0] or ""
+        mime_type = _guess_mime(input_path.suffix.lower()) or ""
         
         if mime_type.startswith("image/"):
             return await self._generate_image_thumb(input_path, output_path)
@@ -561,28 +908,41 @@ class ThumbnailGenerator:
         input_path: Path,
         output_path: Optional[Path]
     ) -> Optional[str]:
-        """Generate thumbnail for image."""
+        """Generate thumbnail for image (in a worker thread)."""
+        return await run_blocking(
+            self._generate_image_thumb_sync, input_path, output_path
+        )
+    
+    def _generate_image_thumb_sync(
+        self,
+        input_path: Path,
+        output_path: Optional[Path]
+    ) -> Optional[str]:
+        """Blocking body of _generate_image_thumb()."""
         try:
             if not output_path:
                 output_path = input_path.with_suffix('.thumb.jpg')
             
             with Image.open(input_path) as img:
-                # Convert to RGB if needed
-                if img.mode in ('RGBA', 'P'):
+                # Palette images resize with NEAREST; expand them first
+                if img.mode == 'P':
                     rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'RGBA':
-                        rgb_img.paste(img, mask=img.split()[3])
-                    else:
-                        rgb_img.paste(img)
+                    rgb_img.paste(img)
                     img = rgb_img
                 
-                # Generate thumbnail
-                img.thumbnail(self.thumb_size, Image.Resampling.LANCZOS)
+                # Generate thumbnail (draft decode + box pre-reduction)
+                img.thumbnail(self.thumb_size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+                
+                # Flatten alpha on the small image, not the original
+                if img.mode == 'RGBA':
+                    rgb_img = Image.new('RGB', img.size, (255, 255, 255))
+                    rgb_img.paste(img, mask=img.getchannel('A'))
+                    img = rgb_img
                 
                 # Save
-                img.save(output_path, format='JPEG', quality=80)
+                _save_jpeg(img, output_path, quality=80)
             
-            logger.debug(f"Thumbnail generated: {output_path}")
+            logger.debug("Thumbnail generated: %s", output_path)
             return str(output_path)
             
         except Exception as e:
@@ -604,31 +964,33 @@ class ThumbnailGenerator:
                 output_path = input_path.with_suffix('.thumb.jpg')
             
             # Get video duration
-            probe = ffmpeg.probe(str(input_path))
+            probe = await _probe(input_path)
             duration = float(probe['format'].get('duration', 0))
             
             # Calculate timestamp for frame
             timestamp = duration * self.video_position
             
-            # Extract frame
-            stream = ffmpeg.input(str(input_path), ss=timestamp)
-            stream = ffmpeg.filter(stream, 'scale', *self.thumb_size)
-            stream = ffmpeg.output(
-                stream,
-                str(output_path),
-                vframes=1,
-                format='image2',
-                vcodec='mjpeg'
-            )
+            # Extract frame (input-side seek, one mjpeg frame)
+            width, height = self.thumb_size
+            argv = [
+                'ffmpeg', '-y',
+                '-ss', str(timestamp),
+                '-i', str(input_path),
+                '-vf', f'scale={width}:{height}',
+                '-frames:v', '1',
+                '-f', 'image2',
+                '-c:v', 'mjpeg',
+                str(output_path)
+            ]
+            
+            # Run ffmpeg and wait for the frame to be written
+            returncode = await _run_ffmpeg(argv)
             
-            # Run ffmpeg
-            await asyncio.create_subprocess_exec(
-                *ffmpeg.compile(stream, overwrite_output=True),
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL
-            )
+            if returncode != 0:
+                logger.error(f"ffmpeg exited with code {returncode} for thumbnail of {input_path}")
+                return None
             
-            logger.debug(f"Video thumbnail generated: {output_path}")
+            logger.debug("Video thumbnail generated: %s", output_path)
             return str(output_path)
             
         except Exception as e: